@@ -1,9 +1,17 @@
 """FastAPI dependency injection: Redis, Publisher, EventService, tenant, correlation_id."""
 
+import email.message
+import json
 import logging
-from typing import Annotated
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, TypeVar
 
 from fastapi import Depends, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.models import Schema
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.json_schema import models_json_schema
 
 from app.application.event_service import EventService
 from app.infrastructure.cache.redis_client import RedisClient
@@ -14,6 +22,8 @@ from app.workflows.dummy_workflow import DummyWorkflowTrigger
 _redis_client: RedisClient | None = None
 _publisher: RabbitMQPublisher | None = None
 
+T = TypeVar("T")
+
 
 def get_redis_client() -> RedisClient:
     """Return singleton Redis client."""
@@ -60,3 +70,105 @@ def get_tenant_id(request: Request) -> str:
 def get_correlation_id(request: Request) -> str:
     """Extract correlation_id from request.state (set by middleware)."""
     return getattr(request.state, "correlation_id", "") or ""
+
+
+# FastAPI's error for a required body that was not sent at all.
+_BODY_MISSING_ERROR = {
+    "type": "missing",
+    "loc": ("body",),
+    "msg": "Field required",
+    "input": None,
+}
+
+# Request models documented by json_body_openapi(), added to components.schemas.
+_JSON_BODY_MODELS: dict[str, type[BaseModel]] = {}
+
+
+def _is_json_content_type(content_type: str | None) -> bool:
+    """Same check FastAPI applies (strict content type): application/json or +json."""
+    if not content_type:
+        return False
+    message = email.message.Message()
+    message["content-type"] = content_type
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+def json_body(adapter: TypeAdapter[T]) -> Callable[[Request], Awaitable[T]]:
+    """Dependency parsing the raw request body with a prebuilt TypeAdapter (validate_json).
+    On failure the body is re-checked the way FastAPI does it (json.loads, then
+    validate_python(from_attributes=True)) so the 422 payload matches a declared body.
+    """
+
+    async def _parse(request: Request) -> T:
+        body = await request.body()
+        if not body:
+            raise RequestValidationError([_BODY_MISSING_ERROR])
+        value: Any = body
+        if _is_json_content_type(request.headers.get("content-type")):
+            try:
+                return adapter.validate_json(body)
+            except ValidationError:
+                pass  # error path only: rebuild FastAPI's errors below
+            try:
+                value = json.loads(body)
+            except json.JSONDecodeError as e:
+                raise RequestValidationError(
+                    [
+                        {
+                            "type": "json_invalid",
+                            "loc": ("body", e.pos),
+                            "msg": "JSON decode error",
+                            "input": {},
+                            "ctx": {"error": e.msg},
+                        }
+                    ],
+                    body=e.doc,
+                ) from e
+        try:
+            return adapter.validate_python(value, from_attributes=True)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**err, "loc": ("body", *err["loc"])}
+                    for err in e.errors(include_url=False)
+                ],
+                body=value,
+            ) from e
+
+    return _parse
+
+
+def json_body_openapi(*models: type[BaseModel]) -> dict[str, Any]:
+    """openapi_extra documenting a JSON body parsed via json_body() (one of models).
+    Models are referenced by $ref; add_json_body_schemas() registers them in components.
+    """
+    refs = []
+    for model in models:
+        _JSON_BODY_MODELS[model.__name__] = model
+        refs.append({"$ref": f"#/components/schemas/{model.__name__}"})
+    schema = refs[0] if len(refs) == 1 else {"anyOf": refs, "title": "Body"}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
+def add_json_body_schemas(openapi_schema: dict[str, Any]) -> dict[str, Any]:
+    """Add models documented by json_body_openapi() (and nested models) to components."""
+    _, top = models_json_schema(
+        [(model, "validation") for model in _JSON_BODY_MODELS.values()],
+        ref_template="#/components/schemas/{model}",
+    )
+    schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+    for name, schema in top.get("$defs", {}).items():
+        # Normalised like FastAPI's own output (e.g. "default": null is dropped).
+        schemas.setdefault(
+            name,
+            jsonable_encoder(Schema(**schema), by_alias=True, exclude_none=True),
+        )
+    return openapi_schema
@@ -7,12 +7,22 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, Header, Request, Response
 from fastapi.responses import JSONResponse
 
-from app.api.dependencies import get_correlation_id, get_event_service, get_tenant_id
+from app.api.dependencies import (
+    get_correlation_id,
+    get_event_service,
+    get_tenant_id,
+    json_body,
+    json_body_openapi,
+)
 from app.application.event_service import EventService
 from app.application.exceptions import ApplicationError, MessagingFailureError
 from app.domain.exceptions import DomainError, DomainValidationError
 from app.domain.models.event import ComplianceEvent, EventStatus
-from app.domain.schemas.event import ComplianceEventCreateRequest, EventResponse
+from app.domain.schemas.event import (
+    COMPLIANCE_EVENT_CREATE_ADAPTER,
+    ComplianceEventCreateRequest,
+    EventResponse,
+)
 from app.domain.validators.event_validator import (
     validate_compliance_event_create_request,
 )
@@ -39,10 +49,17 @@ def _request_to_compliance_event(
     )
 
 
-@router.post("/", response_model=EventResponse)
+@router.post(
+    "/",
+    response_model=EventResponse,
+    openapi_extra=json_body_openapi(ComplianceEventCreateRequest),
+)
 async def create_compliance_event(
     request: Request,
-    body: ComplianceEventCreateRequest,
+    body: Annotated[
+        ComplianceEventCreateRequest,
+        Depends(json_body(COMPLIANCE_EVENT_CREATE_ADAPTER)),
+    ],
     x_idempotency_key: Annotated[
         Optional[str], Header(alias="X-Idempotency-Key")
     ] = None,
@@ -7,12 +7,19 @@ from typing import Annotated, Optional, Union
 from fastapi import APIRouter, Depends, Header, Request, Response
 from fastapi.responses import JSONResponse
 
-from app.api.dependencies import get_correlation_id, get_event_service, get_tenant_id
+from app.api.dependencies import (
+    get_correlation_id,
+    get_event_service,
+    get_tenant_id,
+    json_body,
+    json_body_openapi,
+)
 from app.application.event_service import EventService
 from app.application.exceptions import ApplicationError, MessagingFailureError
 from app.domain.exceptions import DomainError, DomainValidationError
 from app.domain.models.event import ComplianceEvent, EventStatus, RiskEvent
 from app.domain.schemas.event import (
+    EVENT_CREATE_ADAPTER,
     ComplianceEventCreateRequest,
     EventResponse,
     RiskEventCreateRequest,
@@ -63,10 +70,19 @@ def _request_to_compliance_event(
     )
 
 
-@router.post("/", response_model=EventResponse)
+@router.post(
+    "/",
+    response_model=EventResponse,
+    openapi_extra=json_body_openapi(
+        RiskEventCreateRequest, ComplianceEventCreateRequest
+    ),
+)
 async def create_event(
     request: Request,
-    body: Union[RiskEventCreateRequest, ComplianceEventCreateRequest],
+    body: Annotated[
+        Union[RiskEventCreateRequest, ComplianceEventCreateRequest],
+        Depends(json_body(EVENT_CREATE_ADAPTER)),
+    ],
     x_idempotency_key: Annotated[
         Optional[str], Header(alias="X-Idempotency-Key")
     ] = None,
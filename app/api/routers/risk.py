@@ -7,12 +7,22 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, Header, Request, Response
 from fastapi.responses import JSONResponse
 
-from app.api.dependencies import get_correlation_id, get_event_service, get_tenant_id
+from app.api.dependencies import (
+    get_correlation_id,
+    get_event_service,
+    get_tenant_id,
+    json_body,
+    json_body_openapi,
+)
 from app.application.event_service import EventService
 from app.application.exceptions import ApplicationError, MessagingFailureError
 from app.domain.exceptions import DomainError, DomainValidationError
 from app.domain.models.event import EventStatus, RiskEvent
-from app.domain.schemas.event import EventResponse, RiskEventCreateRequest
+from app.domain.schemas.event import (
+    RISK_EVENT_CREATE_ADAPTER,
+    EventResponse,
+    RiskEventCreateRequest,
+)
 from app.domain.validators.event_validator import validate_risk_event_create_request
 
 router = APIRouter()
@@ -35,10 +45,16 @@ def _request_to_risk_event(tenant_id: str, req: RiskEventCreateRequest) -> RiskE
     )
 
 
-@router.post("/", response_model=EventResponse)
+@router.post(
+    "/",
+    response_model=EventResponse,
+    openapi_extra=json_body_openapi(RiskEventCreateRequest),
+)
 async def create_risk_event(
     request: Request,
-    body: RiskEventCreateRequest,
+    body: Annotated[
+        RiskEventCreateRequest, Depends(json_body(RISK_EVENT_CREATE_ADAPTER))
+    ],
     x_idempotency_key: Annotated[
         Optional[str], Header(alias="X-Idempotency-Key")
     ] = None,
@@ -64,6 +64,10 @@ class EventService:
         self._publisher = publisher
         self._redis = redis_client
         self._workflow_trigger = workflow_trigger
+        # No-op triggers (DummyWorkflowTrigger) expose start_sync(); skip the coroutine for them.
+        self._workflow_trigger_is_noop = (
+            getattr(workflow_trigger, "is_noop", False) is True
+        )
         self._logger = logger
 
     async def create_event(
@@ -136,10 +140,16 @@ class EventService:
 
         # Step 4 — Trigger workflow (placeholder); failure does NOT break transaction
         try:
-            await self._workflow_trigger.start(
-                event_id=persisted.event_id,
-                tenant_id=persisted.tenant_id,
-            )
+            if self._workflow_trigger_is_noop:
+                self._workflow_trigger.start_sync(
+                    event_id=persisted.event_id,
+                    tenant_id=persisted.tenant_id,
+                )
+            else:
+                await self._workflow_trigger.start(
+                    event_id=persisted.event_id,
+                    tenant_id=persisted.tenant_id,
+                )
             self._logger.info(
                 "workflow_triggered",
                 extra={
@@ -1 +1 @@
-# app/core — request-scoped context (correlation_id, tenant_id)
+# app/core — request-scoped context (correlation_id, tenant_id) and shared TTL cache
@@ -0,0 +1,93 @@
+"""Bounded in-process TTL/LRU cache with single-flight loading. No FastAPI, no I/O."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU of values keyed by K, bounded to max_size; entries expire after ttl_seconds.
+    get_or_load() is single-flight: concurrent misses on a key share one load(), including
+    its exception. If the caller running the load is cancelled, waiters take it over rather
+    than being cancelled with it. None results are returned but never cached.
+    Values are shared by reference, so they must be immutable.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._inflight: dict[K, asyncio.Future[V | None]] = {}
+        # Bumped by discard_where(); a load that straddles a discard is not cached.
+        self._generation = 0
+
+    def get(self, key: K) -> V | None:
+        """Return cached value if present and fresh; otherwise None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Cache value for key. Evicts least recently used beyond max_size."""
+        if self._max_size <= 0 or self._ttl <= 0:
+            return
+        self._entries[key] = (value, time.monotonic() + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> None:
+        """Drop every entry whose key matches; loads already in flight are not cached."""
+        self._generation += 1
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+
+    async def get_or_load(
+        self, key: K, load: Callable[[], Awaitable[V | None]]
+    ) -> V | None:
+        """Return cached value, else await load() (shared by concurrent misses) and cache it."""
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the leader's cancellation cancels pending: retry (join a new load
+                # or lead one). Our own cancellation leaves pending alone and propagates.
+                if not pending.cancelled():
+                    raise
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[key] = pending
+        generation = self._generation
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except BaseException as e:
+            pending.set_exception(e)
+            pending.exception()  # retrieved here; waiters (if any) re-raise it
+            raise
+        else:
+            pending.set_result(value)
+            if value is not None and generation == self._generation:
+                self.put(key, value)
+            return value
+        finally:
+            del self._inflight[key]
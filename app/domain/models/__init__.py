@@ -5,6 +5,7 @@ from app.domain.models.event import (
     ComplianceEvent,
     EventStatus,
     RiskEvent,
+    validate_transition,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "ComplianceEvent",
     "EventStatus",
     "RiskEvent",
+    "validate_transition",
 ]
@@ -34,10 +34,20 @@ _STATUS_TRANSITIONS: Dict[EventStatus, FrozenSet[EventStatus]] = {
 }
 
 
-def _validate_transition(current: EventStatus, new: EventStatus) -> None:
+# Flat bitmask view of _STATUS_TRANSITIONS, indexed by declaration order:
+# bit to._idx of _ALLOWED_MASK[from._idx] is set iff from -> to is allowed.
+for _i, _status in enumerate(EventStatus):
+    _status._idx = _i
+del _i, _status
+
+_ALLOWED_MASK: tuple[int, ...] = tuple(
+    sum(1 << to._idx for to in _STATUS_TRANSITIONS[status]) for status in EventStatus
+)
+
+
+def validate_transition(current: EventStatus, new: EventStatus) -> None:
     """Validate that transition from current to new is allowed. Raises if invalid."""
-    allowed = _STATUS_TRANSITIONS.get(current, frozenset())
-    if new not in allowed:
+    if not (_ALLOWED_MASK[current._idx] >> new._idx) & 1:
         raise InvalidStatusTransitionError(
             f"Invalid status transition from {current.value} to {new.value}"
         )
@@ -61,7 +71,7 @@ class BaseEvent:
         Transition to a new status if allowed. Mutates status in place.
         Raises InvalidStatusTransitionError if transition is not allowed.
         """
-        _validate_transition(self.status, new_status)
+        validate_transition(self.status, new_status)
         object.__setattr__(self, "status", new_status)
 
 
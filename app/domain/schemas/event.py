@@ -4,7 +4,7 @@ import json
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from app.domain.models.event import EventStatus
 
@@ -71,6 +71,19 @@ class ComplianceEventCreateRequest(BaseModel):
         return v
 
 
+# Validators built once at import; the API layer parses raw JSON bytes through these
+# (validate_json) instead of decoding into a dict and re-validating per request.
+RISK_EVENT_CREATE_ADAPTER: TypeAdapter[RiskEventCreateRequest] = TypeAdapter(
+    RiskEventCreateRequest
+)
+COMPLIANCE_EVENT_CREATE_ADAPTER: TypeAdapter[ComplianceEventCreateRequest] = (
+    TypeAdapter(ComplianceEventCreateRequest)
+)
+EVENT_CREATE_ADAPTER: TypeAdapter[
+    RiskEventCreateRequest | ComplianceEventCreateRequest
+] = TypeAdapter(RiskEventCreateRequest | ComplianceEventCreateRequest)
+
+
 # ---------------------------------------------------------------------------
 # Response schema
 # ---------------------------------------------------------------------------
@@ -1,16 +1,19 @@
 """Validators for event domain rules. Pure functions, no infrastructure or DB access."""
 
-import json
 from typing import Any, Dict, Optional
 
 from app.domain.exceptions import (
     DomainValidationError,
     InvalidMetadataError,
-    InvalidStatusTransitionError,
     InvalidTenantError,
     RiskThresholdViolationError,
 )
-from app.domain.models.event import EventStatus, RiskEvent, ComplianceEvent
+from app.domain.models.event import (
+    ComplianceEvent,
+    EventStatus,
+    RiskEvent,
+    validate_transition,
+)
 from app.domain.schemas.event import (
     ComplianceEventCreateRequest,
     RiskEventCreateRequest,
@@ -23,7 +26,7 @@ RISK_SCORE_MAX = 100
 
 def validate_tenant_id(tenant_id: str) -> None:
     """Enforce tenant constraint: must not be empty. Raises InvalidTenantError if invalid."""
-    if not tenant_id or not tenant_id.strip():
+    if not tenant_id or tenant_id.isspace():
         raise InvalidTenantError("tenant_id must not be empty")
 
 
@@ -37,38 +40,41 @@ def validate_risk_score(risk_score: Optional[float]) -> None:
         )
 
 
+# Types json.dumps accepts as-is (also valid as dict keys, which it coerces to str).
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_serializable(value: Any, active: set[int]) -> bool:
+    """Type-walk equivalent of json.dumps succeeding; active tracks containers on the path."""
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, (dict, list, tuple)):
+        if id(value) in active:
+            return False  # circular reference
+        active.add(id(value))
+        if isinstance(value, dict):
+            ok = all(
+                isinstance(k, _JSON_SCALARS) and _is_json_serializable(v, active)
+                for k, v in value.items()
+            )
+        else:
+            ok = all(_is_json_serializable(v, active) for v in value)
+        active.discard(id(value))
+        return ok
+    return False
+
+
 def validate_metadata_json_serializable(metadata: Optional[Dict[str, Any]]) -> None:
     """Ensure metadata is JSON-serializable. Raises InvalidMetadataError if not."""
     if metadata is None:
         return
-    try:
-        json.dumps(metadata)
-    except (TypeError, ValueError) as e:
-        raise InvalidMetadataError("metadata must be JSON-serializable") from e
+    if not _is_json_serializable(metadata, set()):
+        raise InvalidMetadataError("metadata must be JSON-serializable")
 
 
 def validate_status_transition(current: EventStatus, new: EventStatus) -> None:
     """Validate that transition from current to new status is allowed. Raises InvalidStatusTransitionError if not."""
-    allowed = _allowed_transitions().get(current, frozenset())
-    if new not in allowed:
-        raise InvalidStatusTransitionError(
-            f"Invalid status transition from {current.value} to {new.value}"
-        )
-
-
-def _allowed_transitions() -> dict:
-    """Allowed status transitions. Pure data, no side effects."""
-    return {
-        EventStatus.RECEIVED: frozenset({EventStatus.VALIDATED, EventStatus.REJECTED}),
-        EventStatus.CREATED: frozenset({EventStatus.VALIDATED, EventStatus.REJECTED}),
-        EventStatus.VALIDATED: frozenset({EventStatus.PROCESSING}),
-        EventStatus.PROCESSING: frozenset(
-            {EventStatus.APPROVED, EventStatus.REJECTED, EventStatus.FAILED}
-        ),
-        EventStatus.APPROVED: frozenset(),
-        EventStatus.REJECTED: frozenset(),
-        EventStatus.FAILED: frozenset(),
-    }
+    validate_transition(current, new)
 
 
 def validate_risk_event_create_request(request: RiskEventCreateRequest) -> None:
@@ -79,7 +85,7 @@ def validate_risk_event_create_request(request: RiskEventCreateRequest) -> None:
     validate_tenant_id(request.tenant_id)
     validate_risk_score(request.risk_score)
     validate_metadata_json_serializable(request.metadata)
-    if not request.version or not request.version.strip():
+    if not request.version or request.version.isspace():
         raise DomainValidationError("version must be set and non-empty")
 
 
@@ -92,7 +98,7 @@ def validate_compliance_event_create_request(
     """
     validate_tenant_id(request.tenant_id)
     validate_metadata_json_serializable(request.metadata)
-    if not request.version or not request.version.strip():
+    if not request.version or request.version.isspace():
         raise DomainValidationError("version must be set and non-empty")
 
 
@@ -1,12 +1,13 @@
 """Governance: audit logging, model/prompt registries, approval workflows. No FastAPI."""
 
-from app.governance.audit_logger import AuditLogger
+from app.governance.audit_logger import AuditLogger, BufferedAuditLogger
 from app.governance.model_registry import ModelRegistry, ModelStatus
 from app.governance.prompt_registry import PromptRegistry
 from app.governance.approval_workflow import ApprovalWorkflow, ApprovalStatus
 
 __all__ = [
     "AuditLogger",
+    "BufferedAuditLogger",
     "ModelRegistry",
     "ModelStatus",
     "PromptRegistry",
@@ -0,0 +1,55 @@
+"""Bounded TTL cache for approved governance records. Positive results only. No FastAPI."""
+
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from app.core.ttl_cache import TTLCache
+
+T = TypeVar("T")
+
+DEFAULT_APPROVAL_CACHE_TTL_SECONDS = 5.0
+DEFAULT_APPROVAL_CACHE_MAX_SIZE = 1024
+
+
+class ApprovalCache(Generic[T]):
+    """
+    Caches approved records keyed by (name, version) for ttl_seconds.
+    Only successful approvals are stored, so rejections are always re-checked.
+    Owning registry invalidates by name on every write. LRU-bounded to max_size.
+    get_or_load() is single-flight: concurrent misses on a key share one lookup.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_APPROVAL_CACHE_TTL_SECONDS,
+        max_size: int = DEFAULT_APPROVAL_CACHE_MAX_SIZE,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._cache: TTLCache[tuple[str, Hashable], T] = TTLCache(
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+
+    def get(self, name: str, version: Hashable) -> T | None:
+        """Return cached record if present and fresh; otherwise None."""
+        return self._cache.get((name, version))
+
+    def put(self, name: str, version: Hashable, record: T) -> None:
+        """Cache an approved record. Evicts least recently used beyond max_size."""
+        self._cache.put((name, version), record)
+
+    def invalidate(self, name: str) -> None:
+        """Drop every cached version of name (including the latest-version entry)."""
+        self._cache.discard_where(lambda key: key[0] == name)
+
+    async def get_or_load(
+        self, name: str, version: Hashable, load: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Return cached record, else await load() and cache its result.
+        Concurrent callers missing on the same key await the first caller's load, including
+        its exception (rejections are shared with concurrent callers, never cached).
+        """
+        if self._ttl <= 0:
+            return await load()
+        # load() raises on rejection, so it never yields None here.
+        return await self._cache.get_or_load((name, version), load)  # type: ignore[return-value]
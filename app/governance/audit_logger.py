@@ -1,9 +1,42 @@
 """Immutable audit logging for regulated traceability. No FastAPI."""
 
+import asyncio
+import logging
 from datetime import datetime, timezone
 
 from app.governance.audit_models import AuditRecord
-from app.governance.audit_repository import AuditRepository
+from app.governance.audit_repository import AuditRepository, BatchAuditRepository
+from app.governance.exceptions import AuditBufferFullError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_MAX_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 30.0
+DEFAULT_BUFFER_MAX_PENDING = 10_000
+
+
+def _make_record(
+    *,
+    actor: str,
+    tenant_id: str,
+    action: str,
+    resource_type: str,
+    resource_id: str,
+    reason: str | None,
+    correlation_id: str,
+    metadata: dict | None,
+) -> AuditRecord:
+    return AuditRecord(
+        actor=actor,
+        tenant_id=tenant_id,
+        action=action,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        reason=reason,
+        correlation_id=correlation_id,
+        metadata=metadata,
+        timestamp_utc=datetime.now(timezone.utc),
+    )
 
 
 class AuditLogger:
@@ -29,7 +62,7 @@ class AuditLogger:
         metadata: dict | None,
     ) -> None:
         """Write immutable audit record. Timestamp is UTC."""
-        record = AuditRecord(
+        record = _make_record(
             actor=actor,
             tenant_id=tenant_id,
             action=action,
@@ -38,6 +71,145 @@ class AuditLogger:
             reason=reason,
             correlation_id=correlation_id,
             metadata=metadata,
-            timestamp_utc=datetime.now(timezone.utc),
         )
         await self._repository.save(record)  # Structured JSON stored via repository
+
+    async def flush(self) -> None:
+        """No-op: records are written synchronously."""
+
+    async def close(self) -> None:
+        """No-op: nothing buffered."""
+
+
+class BufferedAuditLogger(AuditLogger):
+    """
+    AuditLogger that buffers records in-process and writes them in batches: one
+    repository.save_many() call for a BatchAuditRepository, else one save() per record.
+    Flushes when max_size records are pending or flush_interval_seconds elapse.
+    Timestamp is taken at log_action time, not at flush. Call close() on shutdown.
+    Failure policy: a failed write keeps the records queued (logged, not raised) for the
+    next flush; once max_pending records are held, log_action raises AuditBufferFullError
+    and the new record is not accepted.
+    """
+
+    def __init__(
+        self,
+        repository: AuditRepository,
+        max_size: int = DEFAULT_BUFFER_MAX_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_BUFFER_MAX_PENDING,
+    ) -> None:
+        if max_pending < max_size:
+            raise ValueError("max_pending must be >= max_size")
+        super().__init__(repository)
+        self._max_size = max_size
+        self._max_pending = max_pending
+        self._flush_interval = flush_interval_seconds
+        self._batch_writes = isinstance(repository, BatchAuditRepository)
+        self._buffer: list[AuditRecord] = []
+        self._in_flight = 0
+        # Pending count that triggers a flush from log_action; pushed back after a failure
+        # so a down repository is not retried with the whole buffer on every record.
+        self._flush_at = max_size
+        self._lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._buffer) + self._in_flight
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run_flusher())
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+    async def log_action(
+        self,
+        *,
+        actor: str,
+        tenant_id: str,
+        action: str,
+        resource_type: str,
+        resource_id: str,
+        reason: str | None,
+        correlation_id: str,
+        metadata: dict | None,
+    ) -> None:
+        """
+        Buffer immutable audit record; flushes when this record fills the buffer.
+        Raises AuditBufferFullError (record dropped) when max_pending records are held.
+        """
+        if self.pending_count >= self._max_pending:
+            raise AuditBufferFullError(
+                f"Audit buffer full ({self._max_pending} records pending); "
+                f"record {action!r} not accepted"
+            )
+        self._buffer.append(
+            _make_record(
+                actor=actor,
+                tenant_id=tenant_id,
+                action=action,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                reason=reason,
+                correlation_id=correlation_id,
+                metadata=metadata,
+            )
+        )
+        if len(self._buffer) >= self._flush_at:
+            await self.flush()
+            return
+        self._ensure_flusher()
+
+    async def flush(self) -> None:
+        """
+        Write all pending records in one batch. On failure the records stay queued for the
+        next flush and the error is logged, not raised: callers never both see an error
+        and have their record persisted later.
+        """
+        async with self._lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            self._in_flight = len(batch)
+            saved = 0
+            try:
+                if self._batch_writes:
+                    await self._repository.save_many(batch)
+                else:
+                    for record in batch:
+                        await self._repository.save(record)
+                        saved += 1
+            except Exception:
+                # Records already written by save() are not re-queued.
+                self._buffer[:0] = batch[saved:]
+                self._flush_at = len(self._buffer) + self._max_size
+                logger.exception(
+                    "audit_buffer_flush_failed", extra={"pending": len(self._buffer)}
+                )
+            except BaseException:
+                self._buffer[:0] = batch[saved:]
+                raise
+            else:
+                self._flush_at = self._max_size
+            finally:
+                self._in_flight = 0
+
+    async def close(self) -> None:
+        """Stop the interval flusher and write any pending records."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+        if self._buffer:
+            logger.error(
+                "audit_buffer_closed_with_pending", extra={"pending": len(self._buffer)}
+            )
@@ -1,6 +1,7 @@
 """Audit repository protocol. Governance layer depends on this; infrastructure implements it."""
 
-from typing import Protocol
+from collections.abc import Sequence
+from typing import Protocol, runtime_checkable
 
 from app.governance.audit_models import AuditRecord
 
@@ -11,3 +12,12 @@ class AuditRepository(Protocol):
     async def save(self, record: AuditRecord) -> None:
         """Persist an immutable audit record. Must not allow mutation."""
         ...
+
+
+@runtime_checkable
+class BatchAuditRepository(AuditRepository, Protocol):
+    """Optional extension: repositories that can persist many records in one round-trip."""
+
+    async def save_many(self, records: Sequence[AuditRecord]) -> None:
+        """Persist a batch of immutable audit records in one round-trip."""
+        ...
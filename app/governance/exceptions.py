@@ -23,3 +23,7 @@ class InvalidWorkflowStateError(GovernanceError):
 
 class PromptNotApprovedError(GovernanceError):
     """Raised when attempting to use a prompt that is not approved or not found."""
+
+
+class AuditBufferFullError(GovernanceError):
+    """Raised when a buffered audit logger is at its hard cap; the record was not accepted."""
@@ -5,6 +5,10 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, Protocol
 
+from app.governance.approval_cache import (
+    DEFAULT_APPROVAL_CACHE_TTL_SECONDS,
+    ApprovalCache,
+)
 from app.governance.audit_logger import AuditLogger
 from app.governance.exceptions import InvalidModelStateError, ModelNotApprovedError
 
@@ -44,15 +48,22 @@ class ModelRegistryRepository(Protocol):
 
 
 class ModelRegistry:
-    """Track model versions and approval status. Approval emits audit log."""
+    """
+    Track model versions and approval status. Approval emits audit log.
+    Approved lookups are cached for approval_cache_ttl_seconds; writes invalidate.
+    """
 
     def __init__(
         self,
         repository: ModelRegistryRepository,
         audit_logger: AuditLogger,
+        approval_cache_ttl_seconds: float = DEFAULT_APPROVAL_CACHE_TTL_SECONDS,
     ) -> None:
         self._repo = repository
         self._audit = audit_logger
+        self._approved_cache: ApprovalCache[ModelRecord] = ApprovalCache(
+            ttl_seconds=approval_cache_ttl_seconds
+        )
 
     async def register_model(
         self,
@@ -75,6 +86,7 @@ class ModelRegistry:
             status=ModelStatus.PENDING,
         )
         await self._repo.save(record)
+        self._approved_cache.invalidate(model_name)
         return record
 
     async def approve_model(
@@ -110,6 +122,7 @@ class ModelRegistry:
             status=ModelStatus.APPROVED,
         )
         await self._repo.save(approved_record)
+        self._approved_cache.invalidate(model_name)
         await self._audit.log_action(
             actor=approved_by,
             tenant_id=tenant_id,
@@ -151,6 +164,7 @@ class ModelRegistry:
             status=ModelStatus.REJECTED,
         )
         await self._repo.save(rejected_record)
+        self._approved_cache.invalidate(model_name)
         await self._audit.log_action(
             actor=rejected_by,
             tenant_id=tenant_id,
@@ -179,6 +193,15 @@ class ModelRegistry:
         version: Optional[str] = None,
     ) -> ModelRecord:
         """Get model and enforce approval. Raises ModelNotApprovedError if not approved."""
+        return await self._approved_cache.get_or_load(
+            model_name,
+            version,
+            lambda: self._load_approved_model(model_name, version),
+        )
+
+    async def _load_approved_model(
+        self, model_name: str, version: str | None
+    ) -> ModelRecord:
         record = await self.get_model(model_name, version)
         if record is None:
             raise ModelNotApprovedError(f"Model not found: {model_name}")
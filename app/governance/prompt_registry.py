@@ -4,6 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import List, Optional, Protocol
 
+from app.governance.approval_cache import (
+    DEFAULT_APPROVAL_CACHE_TTL_SECONDS,
+    ApprovalCache,
+)
 from app.governance.audit_logger import AuditLogger
 from app.governance.exceptions import PromptNotApprovedError
 
@@ -38,15 +42,22 @@ class PromptRegistryRepository(Protocol):
 
 
 class PromptRegistry:
-    """Versioned prompt tracking. Store change_reason, author. Audit every change."""
+    """
+    Versioned prompt tracking. Store change_reason, author. Audit every change.
+    Approved lookups are cached for approval_cache_ttl_seconds; writes invalidate.
+    """
 
     def __init__(
         self,
         repository: PromptRegistryRepository,
         audit_logger: AuditLogger,
+        approval_cache_ttl_seconds: float = DEFAULT_APPROVAL_CACHE_TTL_SECONDS,
     ) -> None:
         self._repo = repository
         self._audit = audit_logger
+        self._approved_cache: ApprovalCache[PromptRecord] = ApprovalCache(
+            ttl_seconds=approval_cache_ttl_seconds
+        )
 
     async def register_prompt(
         self,
@@ -72,6 +83,7 @@ class PromptRegistry:
             created_at=datetime.now(timezone.utc),
         )
         await self._repo.save(record)
+        self._approved_cache.invalidate(prompt_id)
         await self._audit.log_action(
             actor=actor,
             tenant_id=tenant_id,
@@ -111,6 +123,7 @@ class PromptRegistry:
             created_at=datetime.now(timezone.utc),
         )
         await self._repo.save(record)
+        self._approved_cache.invalidate(prompt_id)
         await self._audit.log_action(
             actor=actor,
             tenant_id=tenant_id,
@@ -142,6 +155,15 @@ class PromptRegistry:
         version: Optional[int] = None,
     ) -> PromptRecord:
         """Get prompt and enforce it is approved for use. Raises PromptNotApprovedError if not found."""
+        return await self._approved_cache.get_or_load(
+            prompt_id,
+            version,
+            lambda: self._load_approved_prompt(prompt_id, version),
+        )
+
+    async def _load_approved_prompt(
+        self, prompt_id: str, version: int | None
+    ) -> PromptRecord:
         record = await self.get_prompt(prompt_id, version)
         if record is None:
             raise PromptNotApprovedError(
@@ -0,0 +1,39 @@
+"""GOVERNANCE_VIOLATION audit records for rejected model/prompt approvals. No FastAPI."""
+
+from app.governance.audit_logger import AuditLogger
+from app.governance.exceptions import ModelNotApprovedError, PromptNotApprovedError
+
+GOVERNANCE_VIOLATION_ACTION = "GOVERNANCE_VIOLATION"
+
+
+async def log_governance_violation(
+    audit_logger: AuditLogger,
+    error: ModelNotApprovedError | PromptNotApprovedError,
+    *,
+    model_name: str,
+    prompt_name: str,
+    tenant_id: str,
+    correlation_id: str,
+    event_id: str,
+) -> None:
+    """
+    Emit one GOVERNANCE_VIOLATION record for a rejected gate, then flush it.
+    (resource_type, resource_id) is ("model", model_name) or ("prompt", prompt_name).
+    Flushing makes the record durable on buffered loggers before the caller re-raises.
+    """
+    resource_type, resource_id = (
+        ("model", model_name)
+        if isinstance(error, ModelNotApprovedError)
+        else ("prompt", prompt_name)
+    )
+    await audit_logger.log_action(
+        actor="system",
+        tenant_id=tenant_id,
+        action=GOVERNANCE_VIOLATION_ACTION,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        reason=error.message,
+        correlation_id=correlation_id,
+        metadata={"exception_type": type(error).__name__, "event_id": event_id},
+    )
+    await audit_logger.flush()
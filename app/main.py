@@ -4,6 +4,7 @@
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
+from app.api.dependencies import add_json_body_schemas
 from app.api.middleware import (
     AuditTriggerMiddleware,
     CorrelationIdMiddleware,
@@ -64,3 +65,16 @@ app.include_router(tenant.router, prefix="/tenant")
 app.include_router(events.router, prefix="/events")
 app.include_router(risk.router, prefix="/risk")
 app.include_router(compliance.router, prefix="/compliance")
+
+
+_default_openapi = app.openapi
+
+
+def _openapi() -> dict:
+    """Default schema plus the request models of routes that parse bodies via json_body()."""
+    if app.openapi_schema is None:
+        add_json_body_schemas(_default_openapi())
+    return app.openapi_schema
+
+
+app.openapi = _openapi
@@ -37,6 +37,32 @@ class FailureCategory(str, Enum):
     UNEXPECTED_ERROR = "UNEXPECTED_ERROR"
 
 
+# Direct exception type -> category. Subclasses resolve via their MRO, so the
+# most specific registered base wins (e.g. AuthorizationError before SecurityError).
+_CATEGORY_BY_TYPE: dict[type, FailureCategory] = {
+    DomainValidationError: FailureCategory.VALIDATION_ERROR,
+    InvalidTenantError: FailureCategory.VALIDATION_ERROR,
+    InvalidMetadataError: FailureCategory.VALIDATION_ERROR,
+    RiskThresholdViolationError: FailureCategory.HIGH_RISK,
+    ModelNotApprovedError: FailureCategory.POLICY_VIOLATION,
+    PromptNotApprovedError: FailureCategory.POLICY_VIOLATION,
+    InvalidModelStateError: FailureCategory.POLICY_VIOLATION,
+    InvalidWorkflowStateError: FailureCategory.WORKFLOW_ERROR,
+    InvalidStatusTransitionError: FailureCategory.WORKFLOW_ERROR,
+    AuthorizationError: FailureCategory.POLICY_VIOLATION,
+    TenantIsolationError: FailureCategory.POLICY_VIOLATION,
+    EncryptionError: FailureCategory.INFRA_ERROR,
+    SecurityError: FailureCategory.INFRA_ERROR,
+    IdempotencyConflictError: FailureCategory.WORKFLOW_ERROR,
+    ApplicationError: FailureCategory.WORKFLOW_ERROR,
+    GovernanceError: FailureCategory.POLICY_VIOLATION,
+    DomainError: FailureCategory.VALIDATION_ERROR,
+}
+
+# Memoized classification per concrete exception type (filled on first miss).
+_CLASSIFY_CACHE: dict[type, FailureCategory] = {}
+
+
 class FailureClassifier:
     """
     Classifies exceptions into FailureCategory. Integrates with MetricsCollector
@@ -46,29 +72,13 @@ class FailureClassifier:
     @staticmethod
     def classify(exception: BaseException) -> FailureCategory:
         """Map exception to FailureCategory. Unknown -> UNEXPECTED_ERROR."""
-        if isinstance(exception, DomainValidationError):
-            return FailureCategory.VALIDATION_ERROR
-        if isinstance(exception, (InvalidTenantError, InvalidMetadataError)):
-            return FailureCategory.VALIDATION_ERROR
-        if isinstance(exception, RiskThresholdViolationError):
-            return FailureCategory.HIGH_RISK
-        if isinstance(
-            exception,
-            (ModelNotApprovedError, PromptNotApprovedError, InvalidModelStateError),
-        ):
-            return FailureCategory.POLICY_VIOLATION
-        if isinstance(
-            exception, (InvalidWorkflowStateError, InvalidStatusTransitionError)
-        ):
-            return FailureCategory.WORKFLOW_ERROR
-        if isinstance(exception, (AuthorizationError, TenantIsolationError)):
-            return FailureCategory.POLICY_VIOLATION
-        if isinstance(exception, (EncryptionError, SecurityError)):
-            return FailureCategory.INFRA_ERROR
-        if isinstance(exception, (IdempotencyConflictError, ApplicationError)):
-            return FailureCategory.WORKFLOW_ERROR
-        if isinstance(exception, GovernanceError):
-            return FailureCategory.POLICY_VIOLATION
-        if isinstance(exception, DomainError):
-            return FailureCategory.VALIDATION_ERROR
-        return FailureCategory.UNEXPECTED_ERROR
+        exc_type = type(exception)
+        category = _CLASSIFY_CACHE.get(exc_type)
+        if category is None:
+            category = FailureCategory.UNEXPECTED_ERROR
+            for base in exc_type.__mro__:
+                if base in _CATEGORY_BY_TYPE:
+                    category = _CATEGORY_BY_TYPE[base]
+                    break
+            _CLASSIFY_CACHE[exc_type] = category
+        return category
@@ -4,6 +4,15 @@ import threading
 from typing import Any
 
 
+def _label_key(name: str, *, tenant_id: str | None, category: str | None) -> str | None:
+    """Canonical labelled-counter key (tenant wins over category); None when unlabelled."""
+    if tenant_id is not None:
+        return f"{name}:tenant={tenant_id}"
+    if category is not None:
+        return f"{name}:category={category}"
+    return None
+
+
 class MetricsCollector:
     """
     In-memory Prometheus-style registry. Tracks counters and histograms.
@@ -27,19 +36,27 @@ class MetricsCollector:
         category: str | None = None,
     ) -> None:
         """Increment a counter. Optional tenant_id or category for dimensional metrics."""
+        key = _label_key(name, tenant_id=tenant_id, category=category)
         with self._lock:
-            if tenant_id is not None:
-                key = f"{name}:tenant={tenant_id}"
-                self._counters_by_labels.setdefault(name, {})[key] = (
-                    self._counters_by_labels.get(name, {}).get(key, 0) + value
-                )
-            elif category is not None:
-                key = f"{name}:category={category}"
-                self._counters_by_labels.setdefault(name, {})[key] = (
-                    self._counters_by_labels.get(name, {}).get(key, 0) + value
-                )
-            else:
+            if key is None:
                 self._counters[name] = self._counters.get(name, 0) + value
+            else:
+                labels = self._counters_by_labels.setdefault(name, {})
+                labels[key] = labels.get(key, 0) + value
+
+    def get_counter(
+        self,
+        name: str,
+        *,
+        tenant_id: str | None = None,
+        category: str | None = None,
+    ) -> float:
+        """Current value of a counter (optionally for one label). Direct key lookup; 0 if unset."""
+        key = _label_key(name, tenant_id=tenant_id, category=category)
+        with self._lock:
+            if key is None:
+                return self._counters.get(name, 0)
+            return self._counters_by_labels.get(name, {}).get(key, 0)
 
     def observe_latency(
         self,
@@ -8,11 +8,20 @@ logger = logging.getLogger(__name__)
 class DummyWorkflowTrigger:
     """Placeholder WorkflowTrigger that only logs. Does not fail the transaction."""
 
+    # Callers may skip the coroutine and call start_sync() directly (see EventService).
+    is_noop = True
+
     async def start(self, event_id: str, tenant_id: str) -> None:
-        logger.info(
-            "workflow_trigger_placeholder",
-            extra={
-                "event_id": event_id,
-                "tenant_id": tenant_id,
-            },
-        )
+        self.start_sync(event_id, tenant_id)
+
+    def start_sync(self, event_id: str, tenant_id: str) -> None:
+        """Synchronous body of start(); nothing to await."""
+        # Skip building the extra dict when INFO is disabled; this runs once per event.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "workflow_trigger_placeholder",
+                extra={
+                    "event_id": event_id,
+                    "tenant_id": tenant_id,
+                },
+            )
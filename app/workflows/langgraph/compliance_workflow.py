@@ -11,6 +11,11 @@ from app.governance.exceptions import (
 )
 from app.governance.model_registry import ModelRegistry
 from app.governance.prompt_registry import PromptRegistry
+from app.governance.violations import log_governance_violation
+from app.workflows.langgraph.local_state_cache import (
+    DEFAULT_LOCAL_CACHE_MAX_SIZE,
+    LocalStateCache,
+)
 from app.workflows.langgraph.nodes.compliance_nodes import (
     apply_guardrails_compliance,
     make_compliance_decision,
@@ -33,6 +38,8 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL_VERSION = "simulated@1"
 DEFAULT_PROMPT_VERSION = 1
+MODEL_NAME = "compliance-model"
+PROMPT_NAME = "compliance-prompt"
 NODE_ORDER = [
     "retrieval",
     "policy_validation",
@@ -50,7 +57,8 @@ class ComplianceWorkflow:
     """
     Compliance workflow with additional compliance gating.
     Automatic approval if low regulatory flags; escalate otherwise.
-    Idempotent when state_store is provided. Optional observability hooks.
+    Idempotent when state_store is provided; a bounded in-process cache fronts the store.
+    Optional observability hooks.
     """
 
     def __init__(
@@ -65,6 +73,7 @@ class ComplianceWorkflow:
         failure_classifier: Optional["FailureClassifier"] = None,
         langfuse_client: Optional["LangfuseClient"] = None,
         evaluation_service: Optional["EvaluationService"] = None,
+        local_cache_size: int = DEFAULT_LOCAL_CACHE_MAX_SIZE,
     ) -> None:
         self._audit = audit_logger
         self._store = state_store
@@ -76,18 +85,19 @@ class ComplianceWorkflow:
         self._failure_classifier = failure_classifier
         self._langfuse = langfuse_client
         self._evaluation = evaluation_service
+        self._local_idem: LocalStateCache[ComplianceState] = LocalStateCache(
+            max_size=local_cache_size
+        )
 
     async def _resolve_versions(self, state: ComplianceState) -> ComplianceState:
         """Set model_version and prompt_version from registries. Enforces model and prompt approval."""
         model_version = DEFAULT_MODEL_VERSION
         prompt_version = DEFAULT_PROMPT_VERSION
         if self._model_registry:
-            record = await self._model_registry.get_approved_model("compliance-model")
+            record = await self._model_registry.get_approved_model(MODEL_NAME)
             model_version = f"{record.model_name}@{record.version}"
         if self._prompt_registry:
-            prompt_record = await self._prompt_registry.get_approved_prompt(
-                "compliance-prompt"
-            )
+            prompt_record = await self._prompt_registry.get_approved_prompt(PROMPT_NAME)
             prompt_version = prompt_record.version
         if (
             state.model_version != model_version
@@ -171,7 +181,10 @@ class ComplianceWorkflow:
 
         try:
             if self._store:
-                cached = await self._store.get_compliance_state(state.event_id)
+                cached = await self._local_idem.get_or_load(
+                    state.event_id,
+                    lambda: self._store.get_compliance_state(state.event_id),
+                )
                 if cached is not None:
                     logger.info(
                         "compliance_workflow_idempotent_skip",
@@ -185,26 +198,14 @@ class ComplianceWorkflow:
             try:
                 current = await self._resolve_versions(state)
             except (ModelNotApprovedError, PromptNotApprovedError) as gov_err:
-                resource_type = (
-                    "model" if isinstance(gov_err, ModelNotApprovedError) else "prompt"
-                )
-                resource_id = (
-                    "compliance-model"
-                    if isinstance(gov_err, ModelNotApprovedError)
-                    else "compliance-prompt"
-                )
-                await self._audit.log_action(
-                    actor="system",
+                await log_governance_violation(
+                    self._audit,
+                    gov_err,
+                    model_name=MODEL_NAME,
+                    prompt_name=PROMPT_NAME,
                     tenant_id=state.tenant_id,
-                    action="GOVERNANCE_VIOLATION",
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    reason=gov_err.message,
                     correlation_id=state.correlation_id,
-                    metadata={
-                        "exception_type": type(gov_err).__name__,
-                        "event_id": state.event_id,
-                    },
+                    event_id=state.event_id,
                 )
                 raise
 
@@ -263,6 +264,7 @@ class ComplianceWorkflow:
 
             if self._store:
                 await self._store.set_compliance_state(current.event_id, current)
+                self._local_idem.put(current.event_id, current)
 
             return current
 
@@ -0,0 +1,27 @@
+"""In-process LRU front-cache for workflow state by event_id. Sits in front of the state store."""
+
+from typing import TypeVar
+
+from app.core.ttl_cache import TTLCache
+
+S = TypeVar("S")
+
+DEFAULT_LOCAL_CACHE_MAX_SIZE = 1024
+DEFAULT_LOCAL_CACHE_TTL_SECONDS = 60.0
+
+
+class LocalStateCache(TTLCache[str, S]):
+    """
+    Bounded LRU of terminal workflow states keyed by event_id. Entries expire after ttl_seconds.
+    Avoids a state-store round-trip for repeated events; the store stays the source of truth.
+    get_or_load() coalesces concurrent misses for the same event_id into one store lookup.
+    The same state object is returned to every caller: states must be immutable (the
+    workflow states are frozen dataclasses).
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_LOCAL_CACHE_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_LOCAL_CACHE_TTL_SECONDS,
+    ) -> None:
+        super().__init__(max_size=max_size, ttl_seconds=ttl_seconds)
@@ -32,7 +32,7 @@ async def retrieve_context_compliance(
         "prompt_version": state.prompt_version,
         "execution_ms": round(elapsed_ms, 2),
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
         tenant_id=state.tenant_id,
@@ -71,7 +71,7 @@ async def validate_policy_compliance(
         "execution_ms": round(elapsed_ms, 2),
         "policy_result": policy_result,
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
         tenant_id=state.tenant_id,
@@ -118,7 +118,7 @@ async def score_risk_compliance(
         "execution_ms": round(elapsed_ms, 2),
         "risk_score": risk_score,
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
         tenant_id=state.tenant_id,
@@ -160,7 +160,7 @@ async def apply_guardrails_compliance(
         "execution_ms": round(elapsed_ms, 2),
         "guardrail_result": guardrail_result,
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
         tenant_id=state.tenant_id,
@@ -192,8 +192,7 @@ async def make_compliance_decision(
     policy_fail = state.policy_result == "FAIL"
     high_risk = (state.risk_score or 0.0) >= HIGH_RISK_THRESHOLD
     guardrail_violation = state.guardrail_result == "VIOLATION"
-    has_regulatory_flags = len(state.regulatory_flags or []) > 0
-    if policy_fail or high_risk or guardrail_violation or has_regulatory_flags:
+    if policy_fail or high_risk or guardrail_violation or state.regulatory_flags:
         final_decision = "REQUIRE_APPROVAL"
         approval_required = True
     else:
@@ -210,7 +209,7 @@ async def make_compliance_decision(
         "final_decision": final_decision,
         "approval_required": approval_required,
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
         tenant_id=state.tenant_id,
@@ -41,7 +41,7 @@ async def make_decision(
         "execution_ms": round(elapsed_ms, 2),
         "final_decision": final_decision,
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
 
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
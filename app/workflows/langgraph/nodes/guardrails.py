@@ -44,7 +44,7 @@ async def apply_guardrails(
         "execution_ms": round(elapsed_ms, 2),
         "guardrail_result": guardrail_result,
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
 
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
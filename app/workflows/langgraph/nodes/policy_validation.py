@@ -10,6 +10,19 @@ from app.workflows.langgraph.state_models import RiskState
 logger = logging.getLogger(__name__)
 
 WORKFLOW_ACTOR = "workflow"
+FAIL_CATEGORIES = frozenset({"sensitive"})
+
+
+def evaluate_policy(raw_event: dict) -> str:
+    """FAIL if metadata sets policy_override or has a FAIL category; otherwise PASS."""
+    metadata = raw_event.get("metadata") or {}
+    if metadata.get("policy_override", False):
+        return "FAIL"
+    # category is client-supplied and may be unhashable; only strings can match.
+    category = metadata.get("category", "")
+    if isinstance(category, str) and category in FAIL_CATEGORIES:
+        return "FAIL"
+    return "PASS"
 
 
 async def validate_policy(
@@ -23,14 +36,7 @@ async def validate_policy(
     Emits audit. If FAIL, downstream decision node will mark REQUIRE_APPROVAL.
     """
     start = time.perf_counter()
-    raw = state.raw_event or {}
-    # Deterministic: fail if metadata has "policy_override" or category is "sensitive"
-    category = (raw.get("metadata") or {}).get("category", "")
-    policy_override = (raw.get("metadata") or {}).get("policy_override", False)
-    if policy_override or category == "sensitive":
-        policy_result = "FAIL"
-    else:
-        policy_result = "PASS"
+    policy_result = evaluate_policy(state.raw_event or {})
     elapsed_ms = (time.perf_counter() - start) * 1000
 
     trail_entry = {
@@ -42,7 +48,7 @@ async def validate_policy(
         "execution_ms": round(elapsed_ms, 2),
         "policy_result": policy_result,
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
 
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
@@ -36,7 +36,7 @@ async def retrieve_context(
         "prompt_version": state.prompt_version,
         "execution_ms": round(elapsed_ms, 2),
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
 
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
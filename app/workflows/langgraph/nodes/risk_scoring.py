@@ -45,7 +45,7 @@ async def score_risk(
         "execution_ms": round(elapsed_ms, 2),
         "risk_score": risk_score,
     }
-    new_trail = list(state.audit_trail) + [trail_entry]
+    new_trail = state.appended_audit_trail(trail_entry)
 
     await audit_logger.log_action(
         actor=WORKFLOW_ACTOR,
@@ -1,8 +1,11 @@
 """Risk workflow: LangGraph-style orchestration — retrieval → policy → scoring → guardrails → decision."""
 
+import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING, Optional
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional
 
 from app.governance.audit_logger import AuditLogger
 from app.governance.exceptions import (
@@ -11,6 +14,11 @@ from app.governance.exceptions import (
 )
 from app.governance.model_registry import ModelRegistry
 from app.governance.prompt_registry import PromptRegistry
+from app.governance.violations import log_governance_violation
+from app.workflows.langgraph.local_state_cache import (
+    DEFAULT_LOCAL_CACHE_MAX_SIZE,
+    LocalStateCache,
+)
 from app.workflows.langgraph.nodes.decision import make_decision
 from app.workflows.langgraph.nodes.guardrails import apply_guardrails
 from app.workflows.langgraph.nodes.policy_validation import validate_policy
@@ -29,8 +37,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# A node bound to its dependencies: state in, new state out.
+NodeFn = Callable[[RiskState], Awaitable[RiskState]]
+# (trace_id, parent_span_id) for node spans; None when tracing is off.
+SpanParent = tuple[str, str] | None
+
 DEFAULT_MODEL_VERSION = "simulated@1"
 DEFAULT_PROMPT_VERSION = 1
+MODEL_NAME = "risk-model"
+PROMPT_NAME = "risk-prompt"
 NODE_ORDER = [
     "retrieval",
     "policy_validation",
@@ -40,15 +55,55 @@ NODE_ORDER = [
 ]
 
 
-def _node_done(state: RiskState, node: str) -> bool:
-    """True if audit_trail shows this node already executed."""
-    return any((e.get("node") == node for e in state.audit_trail))
+def _completed_nodes(state: RiskState) -> set[str]:
+    """Names of nodes audit_trail shows as already executed (one pass over the trail)."""
+    return {e.get("node") for e in state.audit_trail}
+
+
+def _join_fan_out(base: RiskState, results: list[tuple[str, RiskState]]) -> RiskState:
+    """
+    Merge concurrently computed node outputs onto base. Each output is base plus one
+    field (named in results) and one trail entry; entries are appended in the given order
+    (NODE_ORDER), so the joined audit trail is deterministic.
+    """
+    trail = list(base.audit_trail)
+    updates = {}
+    for field_name, out in results:
+        updates[field_name] = getattr(out, field_name)
+        trail.append(out.audit_trail[-1])
+    return base.transition(audit_trail=trail, **updates)
+
+
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """
+    Like asyncio.gather, but the first failure cancels the still-running siblings and is
+    re-raised as is (no ExceptionGroup). Also cancels all of them if the caller is cancelled.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    for task in pending:
+        task.cancel()
+    # Await every task (retrieving each failure, so none is logged as never retrieved),
+    # then raise the first real failure in node order.
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for task, result in zip(tasks, results):
+        if not task.cancelled() and isinstance(result, BaseException):
+            raise result
+    return results
 
 
 class RiskWorkflow:
     """
     Orchestrated risk workflow. Idempotent: if state cached for event_id, return it.
-    Otherwise run: retrieval → policy_validation → risk_scoring → guardrails → decision.
+    A bounded in-process cache fronts the state store and coalesces concurrent lookups.
+    Otherwise run: (retrieval | policy_validation | risk_scoring) → guardrails → decision.
+    The first three nodes only read raw_event and versions, so they fan out concurrently.
     Deterministic; no randomness. Emits audit at each stage; logs model and prompt version.
     Optional observability: metrics, tracing, cost, failure classification, evaluation.
     """
@@ -65,6 +120,7 @@ class RiskWorkflow:
         failure_classifier: Optional["FailureClassifier"] = None,
         langfuse_client: Optional["LangfuseClient"] = None,
         evaluation_service: Optional["EvaluationService"] = None,
+        local_cache_size: int = DEFAULT_LOCAL_CACHE_MAX_SIZE,
     ) -> None:
         self._audit = audit_logger
         self._store = state_store
@@ -76,19 +132,58 @@ class RiskWorkflow:
         self._failure_classifier = failure_classifier
         self._langfuse = langfuse_client
         self._evaluation = evaluation_service
+        self._local_idem: LocalStateCache[RiskState] = LocalStateCache(
+            max_size=local_cache_size
+        )
+        # Node plan built once per instance, dependencies bound here rather than per run:
+        # (name, field the node sets, node) for the fan-out, then the sequential tail.
+        self._fan_out_nodes: tuple[tuple[str, str, NodeFn], ...] = (
+            (
+                "retrieval",
+                "retrieved_context",
+                partial(retrieve_context, audit_logger=audit_logger),
+            ),
+            (
+                "policy_validation",
+                "policy_result",
+                partial(validate_policy, audit_logger=audit_logger),
+            ),
+            (
+                "risk_scoring",
+                "risk_score",
+                partial(score_risk, audit_logger=audit_logger),
+            ),
+        )
+        self._tail_nodes: tuple[tuple[str, NodeFn], ...] = (
+            ("guardrails", partial(apply_guardrails, audit_logger=audit_logger)),
+            ("decision", partial(make_decision, audit_logger=audit_logger)),
+        )
+
+    async def _approved_model_version(self) -> str:
+        if not self._model_registry:
+            return DEFAULT_MODEL_VERSION
+        record = await self._model_registry.get_approved_model(MODEL_NAME)
+        return f"{record.model_name}@{record.version}"
+
+    async def _approved_prompt_version(self) -> int:
+        if not self._prompt_registry:
+            return DEFAULT_PROMPT_VERSION
+        prompt_record = await self._prompt_registry.get_approved_prompt(PROMPT_NAME)
+        return prompt_record.version
 
     async def _resolve_versions(self, state: RiskState) -> RiskState:
-        """Set model_version and prompt_version from registries. Enforces model and prompt approval."""
-        model_version = DEFAULT_MODEL_VERSION
-        prompt_version = DEFAULT_PROMPT_VERSION
-        if self._model_registry:
-            record = await self._model_registry.get_approved_model("risk-model")
-            model_version = f"{record.model_name}@{record.version}"
-        if self._prompt_registry:
-            prompt_record = await self._prompt_registry.get_approved_prompt(
-                "risk-prompt"
-            )
-            prompt_version = prompt_record.version
+        """
+        Set model_version and prompt_version from registries. Enforces model and prompt approval.
+        Both lookups run concurrently; on failure the model error wins (deterministic order).
+        """
+        model_version, prompt_version = await asyncio.gather(
+            self._approved_model_version(),
+            self._approved_prompt_version(),
+            return_exceptions=True,
+        )
+        for result in (model_version, prompt_version):
+            if isinstance(result, BaseException):
+                raise result
         if (
             state.model_version != model_version
             or state.prompt_version != prompt_version
@@ -98,77 +193,101 @@ class RiskWorkflow:
             )
         return state
 
+    async def _enforce_governance(self, state: RiskState) -> RiskState:
+        """
+        Resolve model/prompt versions, enforcing approval. On rejection, emit one
+        GOVERNANCE_VIOLATION audit record (flushed) and re-raise.
+        """
+        try:
+            return await self._resolve_versions(state)
+        except (ModelNotApprovedError, PromptNotApprovedError) as gov_err:
+            await log_governance_violation(
+                self._audit,
+                gov_err,
+                model_name=MODEL_NAME,
+                prompt_name=PROMPT_NAME,
+                tenant_id=state.tenant_id,
+                correlation_id=state.correlation_id,
+                event_id=state.event_id,
+            )
+            raise
+
+    async def _run_node(
+        self, name: str, node: NodeFn, state: RiskState, span_parent: SpanParent
+    ) -> RiskState:
+        """Run one node with its tracing span and latency/usage metrics."""
+        node_start = time.perf_counter()
+        if self._tracing and span_parent:
+            trace_id, parent_span_id = span_parent
+            async with self._tracing.start_span(
+                name,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+                tenant_id=state.tenant_id,
+                correlation_id=state.correlation_id,
+                model_version=state.model_version,
+                prompt_version=state.prompt_version,
+            ):
+                out = await node(state)
+        else:
+            out = await node(state)
+        elapsed_ms = (time.perf_counter() - node_start) * 1000
+        if self._metrics:
+            self._metrics.observe_latency(
+                "node_execution_latency", elapsed_ms, node=name
+            )
+            self._metrics.increment("model_usage_count")
+            self._metrics.increment("prompt_usage_count")
+        return out
+
+    async def _run_nodes(self, state: RiskState, span_parent: SpanParent) -> RiskState:
+        """
+        Fan-out: independent nodes run concurrently on the same input state; a failing node
+        cancels its siblings. The join merges their fields and trail entries, then the tail
+        runs in order.
+        Nodes already recorded in audit_trail are skipped.
+        """
+        done = _completed_nodes(state)
+        fan_out = [
+            (name, field_name, node)
+            for name, field_name, node in self._fan_out_nodes
+            if name not in done
+        ]
+        if fan_out:
+            outs = await _gather_or_cancel(
+                *(
+                    self._run_node(name, node, state, span_parent)
+                    for name, _, node in fan_out
+                )
+            )
+            state = _join_fan_out(
+                state,
+                [(field_name, out) for (_, field_name, _), out in zip(fan_out, outs)],
+            )
+        for name, node in self._tail_nodes:
+            if name not in done:
+                state = await self._run_node(name, node, state, span_parent)
+        return state
+
     async def run(self, state: RiskState) -> RiskState:
         """
         Run workflow. If state_store has cached state for this event_id, return it (idempotent).
-        Otherwise run each node in order with observability hooks; then cache and return.
+        The caller's state is never trusted as terminal: it always passes the governance gate.
+        Otherwise run the nodes (fan-out, then guardrails and decision) with observability
+        hooks; then cache and return.
         """
         if self._metrics:
             self._metrics.increment("request_count", 1, tenant_id=state.tenant_id)
             self._metrics.increment("workflow_execution_count")
 
         request_start = time.perf_counter()
-        trace_id: Optional[str] = None
-        parent_span_id: Optional[str] = None
-        current: RiskState = state
-
-        async def run_node(name: str, run_fn):
-            nonlocal current
-            node_start = time.perf_counter()
-            if self._tracing and trace_id:
-                async with self._tracing.start_span(
-                    name,
-                    trace_id=trace_id,
-                    parent_span_id=parent_span_id,
-                    tenant_id=current.tenant_id,
-                    correlation_id=current.correlation_id,
-                    model_version=current.model_version,
-                    prompt_version=current.prompt_version,
-                ):
-                    out = await run_fn()
-            else:
-                out = await run_fn()
-            elapsed_ms = (time.perf_counter() - node_start) * 1000
-            if self._metrics:
-                self._metrics.observe_latency(
-                    "node_execution_latency", elapsed_ms, node=name
-                )
-                self._metrics.increment("model_usage_count")
-                self._metrics.increment("prompt_usage_count")
-            return out
-
-        async def run_all_nodes() -> RiskState:
-            nonlocal current
-            if not _node_done(current, "retrieval"):
-                current = await run_node(
-                    "retrieval",
-                    lambda: retrieve_context(current, audit_logger=self._audit),
-                )
-            if not _node_done(current, "policy_validation"):
-                current = await run_node(
-                    "policy_validation",
-                    lambda: validate_policy(current, audit_logger=self._audit),
-                )
-            if not _node_done(current, "risk_scoring"):
-                current = await run_node(
-                    "risk_scoring",
-                    lambda: score_risk(current, audit_logger=self._audit),
-                )
-            if not _node_done(current, "guardrails"):
-                current = await run_node(
-                    "guardrails",
-                    lambda: apply_guardrails(current, audit_logger=self._audit),
-                )
-            if not _node_done(current, "decision"):
-                current = await run_node(
-                    "decision",
-                    lambda: make_decision(current, audit_logger=self._audit),
-                )
-            return current
 
         try:
             if self._store:
-                cached = await self._store.get_risk_state(state.event_id)
+                cached = await self._local_idem.get_or_load(
+                    state.event_id,
+                    lambda: self._store.get_risk_state(state.event_id),
+                )
                 if cached is not None:
                     logger.info(
                         "workflow_idempotent_skip",
@@ -179,31 +298,10 @@ class RiskWorkflow:
                     )
                     return cached
 
-            try:
-                current = await self._resolve_versions(state)
-            except (ModelNotApprovedError, PromptNotApprovedError) as gov_err:
-                resource_type = (
-                    "model" if isinstance(gov_err, ModelNotApprovedError) else "prompt"
-                )
-                resource_id = (
-                    "risk-model"
-                    if isinstance(gov_err, ModelNotApprovedError)
-                    else "risk-prompt"
-                )
-                await self._audit.log_action(
-                    actor="system",
-                    tenant_id=state.tenant_id,
-                    action="GOVERNANCE_VIOLATION",
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    reason=gov_err.message,
-                    correlation_id=state.correlation_id,
-                    metadata={
-                        "exception_type": type(gov_err).__name__,
-                        "event_id": state.event_id,
-                    },
-                )
-                raise
+            # Governance gate: fail fast before any node, span or graph work. Runs for every
+            # caller-built state, including ones whose trail already shows a decision; only
+            # states loaded from the store or local cache above skip it.
+            current = await self._enforce_governance(state)
 
             if self._tracing:
                 async with self._tracing.start_span(
@@ -211,11 +309,11 @@ class RiskWorkflow:
                     tenant_id=state.tenant_id,
                     correlation_id=state.correlation_id,
                 ) as root_span:
-                    trace_id = root_span.trace_id
-                    parent_span_id = root_span.span_id
-                    current = await run_all_nodes()
+                    current = await self._run_nodes(
+                        current, (root_span.trace_id, root_span.span_id)
+                    )
             else:
-                current = await run_all_nodes()
+                current = await self._run_nodes(current, None)
 
             if self._metrics and current.final_decision == "REQUIRE_APPROVAL":
                 self._metrics.increment("approval_required_count")
@@ -257,6 +355,7 @@ class RiskWorkflow:
 
             if self._store:
                 await self._store.set_risk_state(current.event_id, current)
+                self._local_idem.put(current.event_id, current)
 
             return current
 
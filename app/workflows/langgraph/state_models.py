@@ -1,20 +1,49 @@
 """Deterministic state containers for AI workflows. Immutable transitions, fully serializable."""
 
-from typing import Any
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import TypeAdapter
 
+_S = TypeVar("_S", "RiskState", "ComplianceState")
 
-class RiskState(BaseModel):
+
+def _intern_event_type(state: _S) -> _S:
+    """Intern raw_event["event_type"] so node lookups/comparisons hit the identity fast path."""
+    event_type = state.raw_event.get("event_type")
+    if isinstance(event_type, str):
+        state.raw_event["event_type"] = sys.intern(event_type)
+    return state
+
+
+def _intern_flags(flags: Iterable[str]) -> tuple[str, ...]:
+    """Interned regulatory flag strings, in the caller's order. A bare str is rejected."""
+    if isinstance(flags, str):
+        raise TypeError("regulatory_flags must be an iterable of strings, not a str")
+    return tuple(map(sys.intern, flags))
+
+
+def _intern_compliance_state(state: "ComplianceState") -> "ComplianceState":
+    """Intern event_type and regulatory_flags of a freshly parsed ComplianceState."""
+    object.__setattr__(state, "regulatory_flags", _intern_flags(state.regulatory_flags))
+    return _intern_event_type(state)
+
+
+@dataclass(slots=True, frozen=True)
+class RiskState:
     """
     State for the risk workflow. All transitions return new state; no in-place mutation.
-    Fully serializable for idempotency cache and audit.
+    Frozen slotted dataclass, shared as is by caches: nested containers (raw_event,
+    audit_trail) must be replaced, never mutated. No validation between nodes. Validate untrusted input once
+    at the boundary with from_api(). Fully serializable for idempotency cache and audit.
     """
 
     event_id: str
     tenant_id: str
     correlation_id: str
-    raw_event: dict[str, Any] = Field(default_factory=dict)
+    raw_event: dict[str, Any] = field(default_factory=dict)
     retrieved_context: str | None = None
     policy_result: str | None = None  # "PASS" | "FAIL"
     risk_score: float | None = None
@@ -22,44 +51,100 @@ class RiskState(BaseModel):
     final_decision: str | None = None  # "APPROVED" | "REQUIRE_APPROVAL"
     model_version: str = "simulated@1"
     prompt_version: int = 1
-    audit_trail: list[dict[str, Any]] = Field(default_factory=list)
+    audit_trail: list[dict[str, Any]] = field(default_factory=list)
     idempotency_key: str | None = None
     evaluation_result: dict[str, Any] | None = None
 
-    model_config = {
-        "frozen": False
-    }  # Pydantic allows copy; we never mutate in place in nodes
-
     def transition(self, **updates: Any) -> "RiskState":
-        """Return a new state with the given updates. Original unchanged."""
-        return self.model_copy(update=updates, deep=True)
+        """
+        Return a new state with the given updates. Original unchanged.
+        Shallow copy: nested containers are shared, so nodes replace them, never mutate.
+        """
+        values = {name: getattr(self, name) for name in _RISK_STATE_FIELDS}
+        values.update(updates)
+        return RiskState(**values)
+
+    def appended_audit_trail(self, entry: dict[str, Any]) -> list[dict[str, Any]]:
+        """New audit trail list with entry appended, built in one allocation."""
+        return [*self.audit_trail, entry]
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "RiskState":
+        """Build a validated state from untrusted input. Raises pydantic.ValidationError."""
+        return _intern_event_type(_RISK_STATE_ADAPTER.validate_python(data))
 
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "RiskState":
+        """Deserialize and validate a JSON document produced by to_json()."""
+        return _intern_event_type(_RISK_STATE_ADAPTER.validate_json(data))
 
-class ComplianceState(BaseModel):
+    def to_json(self) -> str:
+        """Serialize state to a JSON string."""
+        return _RISK_STATE_ADAPTER.dump_json(self).decode()
+
+
+@dataclass(slots=True, frozen=True)
+class ComplianceState:
     """
     State for the compliance workflow. Similar to RiskState with compliance-specific fields.
-    Immutable transitions; fully serializable.
+    Frozen like RiskState (nested containers are never mutated); fully serializable.
     """
 
     event_id: str
     tenant_id: str
     correlation_id: str
-    raw_event: dict[str, Any] = Field(default_factory=dict)
+    raw_event: dict[str, Any] = field(default_factory=dict)
     retrieved_context: str | None = None
     policy_result: str | None = None
     risk_score: float | None = None
     guardrail_result: str | None = None
-    regulatory_flags: list[str] = Field(default_factory=list)
+    regulatory_flags: tuple[str, ...] = ()
     approval_required: bool = False
     final_decision: str | None = None
     model_version: str = "simulated@1"
     prompt_version: int = 1
-    audit_trail: list[dict[str, Any]] = Field(default_factory=list)
+    audit_trail: list[dict[str, Any]] = field(default_factory=list)
     idempotency_key: str | None = None
     evaluation_result: dict[str, Any] | None = None
 
-    model_config = {"frozen": False}
+    def __post_init__(self) -> None:
+        # Accept any iterable of flags (e.g. a list) but always store a tuple of interned
+        # strings; every input is checked, tuples included (interning is idempotent).
+        object.__setattr__(
+            self, "regulatory_flags", _intern_flags(self.regulatory_flags)
+        )
 
     def transition(self, **updates: Any) -> "ComplianceState":
-        """Return a new state with the given updates. Original unchanged."""
-        return self.model_copy(update=updates, deep=True)
+        """Return a new state with the given updates. Original unchanged (shallow copy)."""
+        values = {name: getattr(self, name) for name in _COMPLIANCE_STATE_FIELDS}
+        values.update(updates)
+        return ComplianceState(**values)
+
+    def appended_audit_trail(self, entry: dict[str, Any]) -> list[dict[str, Any]]:
+        """New audit trail list with entry appended, built in one allocation."""
+        return [*self.audit_trail, entry]
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "ComplianceState":
+        """Build a validated state from untrusted input. Raises pydantic.ValidationError."""
+        return _intern_compliance_state(_COMPLIANCE_STATE_ADAPTER.validate_python(data))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "ComplianceState":
+        """Deserialize and validate a JSON document produced by to_json()."""
+        return _intern_compliance_state(_COMPLIANCE_STATE_ADAPTER.validate_json(data))
+
+    def to_json(self) -> str:
+        """Serialize state to a JSON string."""
+        return _COMPLIANCE_STATE_ADAPTER.dump_json(self).decode()
+
+
+# Field names resolved once; transition() copies these instead of dataclasses.replace(),
+# which re-walks fields() and their init flags on every call.
+_RISK_STATE_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(RiskState))
+_COMPLIANCE_STATE_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(ComplianceState)
+)
+
+_RISK_STATE_ADAPTER: TypeAdapter[RiskState] = TypeAdapter(RiskState)
+_COMPLIANCE_STATE_ADAPTER: TypeAdapter[ComplianceState] = TypeAdapter(ComplianceState)
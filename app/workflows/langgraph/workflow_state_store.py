@@ -31,20 +31,20 @@ class ComplianceStateStore(Protocol):
 
 def _risk_state_to_json(state: RiskState) -> str:
     """Serialize RiskState to JSON string."""
-    return state.model_dump_json()
+    return state.to_json()
 
 
 def _risk_state_from_json(data: str) -> RiskState:
     """Deserialize JSON string to RiskState."""
-    return RiskState.model_validate_json(data)
+    return RiskState.from_json(data)
 
 
 def _compliance_state_to_json(state: ComplianceState) -> str:
-    return state.model_dump_json()
+    return state.to_json()
 
 
 def _compliance_state_from_json(data: str) -> ComplianceState:
-    return ComplianceState.model_validate_json(data)
+    return ComplianceState.from_json(data)
 
 
 class RedisWorkflowStateStore:
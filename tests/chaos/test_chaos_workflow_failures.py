@@ -5,7 +5,7 @@ Tests either inject real failure via mocks or are explicitly named for what they
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 from app.domain.exceptions import DomainValidationError
 from app.observability.failure_classifier import FailureClassifier
@@ -15,10 +15,8 @@ from app.workflows.langgraph.risk_workflow import RiskWorkflow
 
 
 @pytest.fixture
-def audit_logger():
-    audit = AsyncMock()
-    audit.log_action = AsyncMock(return_value=None)
-    return audit
+def audit_logger(spy_audit_logger):
+    return spy_audit_logger
 
 
 @pytest.mark.asyncio
@@ -61,12 +59,6 @@ async def test_workflow_injected_failure_classified_and_metrics(audit_logger):
 
     metrics = MetricsCollector()
     classifier = FailureClassifier()
-    workflow = RiskWorkflow(
-        audit_logger=audit_logger,
-        state_store=None,
-        metrics_collector=metrics,
-        failure_classifier=classifier,
-    )
     state = RiskState(
         event_id="chaos-fail-1",
         tenant_id="t1",
@@ -76,13 +68,20 @@ async def test_workflow_injected_failure_classified_and_metrics(audit_logger):
         prompt_version=1,
         audit_trail=[],
     )
+    # Nodes are bound when the workflow is built, so patch before constructing it.
     with patch.object(risk_workflow, "retrieve_context", side_effect=failing_retrieval):
+        workflow = RiskWorkflow(
+            audit_logger=audit_logger,
+            state_store=None,
+            metrics_collector=metrics,
+            failure_classifier=classifier,
+        )
         with pytest.raises(DomainValidationError, match="chaos injection"):
             await workflow.run(state)
     out = metrics.export_metrics()
     assert out["counters_by_labels"].get("failure_count") is not None
     failure_by_cat = out["counters_by_labels"]["failure_count"]
-    assert any("VALIDATION_ERROR" in k for k in failure_by_cat)
+    assert metrics.get_counter("failure_count", category="VALIDATION_ERROR") == 1
     assert sum(failure_by_cat.values()) == 1
 
 
@@ -1 +1,36 @@
 """Pytest configuration and shared fixtures."""
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # optional "perf" extra; fall back to the default asyncio loop
+    uvloop = None
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed (cheaper task switches)."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+class _SpyAuditLogger:
+    """Audit logger fake: log_action records its keyword arguments, flush is counted.
+    Plain async methods, so no AsyncMock machinery per call in throughput-sensitive tests.
+    """
+
+    def __init__(self) -> None:
+        self.actions: list[dict] = []
+        self.flush_count = 0
+
+    async def log_action(self, **kwargs) -> None:
+        self.actions.append(kwargs)
+
+    async def flush(self) -> None:
+        self.flush_count += 1
+
+
+@pytest.fixture
+def spy_audit_logger():
+    return _SpyAuditLogger()
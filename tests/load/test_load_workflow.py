@@ -6,7 +6,6 @@ Asserts: no data corruption, no cross-tenant leakage, no deadlocks, no race cond
 
 import asyncio
 import time
-from unittest.mock import AsyncMock
 
 import pytest
 
@@ -32,10 +31,8 @@ def _make_state(event_id: str, tenant_id: str, i: int) -> RiskState:
 
 
 @pytest.fixture
-def audit_logger():
-    audit = AsyncMock()
-    audit.log_action = AsyncMock(return_value=None)
-    return audit
+def audit_logger(spy_audit_logger):
+    return spy_audit_logger
 
 
 @pytest.mark.asyncio
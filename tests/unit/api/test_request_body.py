@@ -0,0 +1,134 @@
+"""Tests for json_body(): 422 payloads and OpenAPI match a body declared the FastAPI way."""
+
+import pytest
+from httpx import AsyncClient
+
+_MISSING_BODY = [
+    {"input": None, "loc": ["body"], "msg": "Field required", "type": "missing"}
+]
+_NOT_A_DICT = "Input should be a valid dictionary or object to extract fields from"
+_FORM = {"tenant_id": "t", "version": "1"}
+_FORM_INPUT = "tenant_id=t&version=1"
+
+
+@pytest.fixture
+def headers(tenant_headers):
+    return {**tenant_headers, "X-Idempotency-Key": "body-key"}
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_body_422_payload(client: AsyncClient, headers):
+    """Valid JSON failing validation: pydantic errors under "body", without "url"."""
+    body = {"tenant_id": "t", "version": "", "risk_score": -1}
+    r = await client.post("/risk/", json=body, headers=headers)
+    assert r.status_code == 422
+    assert r.json() == {
+        "detail": [
+            {
+                "ctx": {"ge": 0.0},
+                "input": -1,
+                "loc": ["body", "risk_score"],
+                "msg": "Input should be greater than or equal to 0",
+                "type": "greater_than_equal",
+            },
+            {
+                "ctx": {"min_length": 1},
+                "input": "",
+                "loc": ["body", "version"],
+                "msg": "String should have at least 1 character",
+                "type": "string_too_short",
+            },
+        ]
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/risk/", "/compliance/", "/events/"])
+@pytest.mark.parametrize("content_type", [None, "application/json"])
+async def test_empty_body_422_payload(client: AsyncClient, headers, path, content_type):
+    """An empty body is reported as a missing body, not as invalid JSON."""
+    if content_type:
+        headers = {**headers, "Content-Type": content_type}
+    r = await client.post(path, content=b"", headers=headers)
+    assert r.status_code == 422
+    assert r.json() == {"detail": _MISSING_BODY}
+
+
+@pytest.mark.asyncio
+async def test_form_body_422_payload(client: AsyncClient, headers):
+    """A non-JSON body is validated as raw text, as FastAPI does, not parsed as JSON."""
+    r = await client.post("/risk/", data=_FORM, headers=headers)
+    assert r.status_code == 422
+    assert r.json() == {
+        "detail": [
+            {
+                "input": _FORM_INPUT,
+                "loc": ["body"],
+                "msg": _NOT_A_DICT,
+                "type": "model_attributes_type",
+            }
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_form_body_union_422_payload(client: AsyncClient, headers):
+    """POST /events reports one error per union member."""
+    r = await client.post("/events/", data=_FORM, headers=headers)
+    assert r.status_code == 422
+    assert r.json() == {
+        "detail": [
+            {
+                "input": _FORM_INPUT,
+                "loc": ["body", model],
+                "msg": _NOT_A_DICT,
+                "type": "model_attributes_type",
+            }
+            for model in ("RiskEventCreateRequest", "ComplianceEventCreateRequest")
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_malformed_json_422_payload(client: AsyncClient, headers):
+    """Unparseable JSON keeps FastAPI's "JSON decode error" with the error position."""
+    headers = {**headers, "Content-Type": "application/json"}
+    r = await client.post("/risk/", content=b'{"tenant_id": ', headers=headers)
+    assert r.status_code == 422
+    assert r.json() == {
+        "detail": [
+            {
+                "ctx": {"error": "Expecting value"},
+                "input": {},
+                "loc": ["body", 14],
+                "msg": "JSON decode error",
+                "type": "json_invalid",
+            }
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_openapi_request_bodies_reference_components(
+    client: AsyncClient, tenant_headers
+):
+    """Request models stay named types in components.schemas, referenced by $ref."""
+    r = await client.get("/openapi.json", headers=tenant_headers)
+    spec = r.json()
+    schemas = spec["components"]["schemas"]
+    assert {"RiskEventCreateRequest", "ComplianceEventCreateRequest"} <= set(schemas)
+    assert "default" not in schemas["RiskEventCreateRequest"]["properties"]["metadata"]
+
+    def body_schema(path):
+        return spec["paths"][path]["post"]["requestBody"]["content"][
+            "application/json"
+        ]["schema"]
+
+    risk_ref = {"$ref": "#/components/schemas/RiskEventCreateRequest"}
+    compliance_ref = {"$ref": "#/components/schemas/ComplianceEventCreateRequest"}
+    assert body_schema("/risk/") == risk_ref
+    assert body_schema("/compliance/") == compliance_ref
+    assert body_schema("/events/") == {
+        "anyOf": [risk_ref, compliance_ref],
+        "title": "Body",
+    }
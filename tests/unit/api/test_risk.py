@@ -51,3 +51,16 @@ async def test_risk_missing_idempotency_key_returns_400(
     body = {"tenant_id": "test-tenant", "version": "1.0"}
     r = await client.post("/risk/", json=body, headers=tenant_headers)
     assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_risk_malformed_json_returns_422(client: AsyncClient, tenant_headers):
+    """POST /risk with a body that is not valid JSON returns 422 located in body."""
+    headers = {
+        **tenant_headers,
+        "X-Idempotency-Key": "risk-key-bad-json",
+        "Content-Type": "application/json",
+    }
+    r = await client.post("/risk/", content=b'{"tenant_id": ', headers=headers)
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"][0] == "body"
@@ -1,7 +1,7 @@
 """Unit tests for EventService.create_event: happy path, idempotency, failures."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,6 +9,7 @@ from app.application.event_repository import PersistedEvent
 from app.application.event_service import EventService
 from app.application.exceptions import MessagingFailureError
 from app.domain.models.event import EventStatus, RiskEvent
+from app.workflows.dummy_workflow import DummyWorkflowTrigger
 
 
 def _risk_event(
@@ -235,3 +236,34 @@ async def test_create_event_workflow_failure_returns_success(
     publisher.publish.assert_awaited_once()
     workflow_trigger.start.assert_awaited_once()
     redis_client.set_cache.assert_awaited_once()
+
+
+# ---------- 6. No-op trigger fast path ----------
+
+
+async def test_create_event_noop_trigger_called_synchronously(
+    repository, publisher, redis_client, logger
+):
+    """DummyWorkflowTrigger (is_noop) is invoked via start_sync; no coroutine is created."""
+    trigger = DummyWorkflowTrigger()
+    service = EventService(
+        repository=repository,
+        publisher=publisher,
+        redis_client=redis_client,
+        workflow_trigger=trigger,
+        logger=logger,
+    )
+    with (
+        patch.object(trigger, "start", AsyncMock()) as start,
+        patch.object(trigger, "start_sync", wraps=trigger.start_sync) as start_sync,
+    ):
+        response = await service.create_event(
+            event=_risk_event(),
+            tenant_id="tenant-1",
+            idempotency_key="key-1",
+            correlation_id="corr-1",
+        )
+
+    assert response.event_id == "evt-123"
+    start_sync.assert_called_once_with(event_id="evt-123", tenant_id="tenant-1")
+    start.assert_not_awaited()
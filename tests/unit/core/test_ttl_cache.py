@@ -0,0 +1,104 @@
+"""TTLCache tests: expiry, LRU bound, single-flight loading, leader cancellation."""
+
+import asyncio
+
+import pytest
+
+from app.core.ttl_cache import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=60.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expired_entry_is_a_miss(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.core.ttl_cache.time.monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(max_size=8, ttl_seconds=5.0)
+    cache.put("a", 1)
+    now[0] += 5.0
+    assert cache.get("a") is None
+
+
+async def test_ttl_cache_none_result_is_not_cached():
+    cache: TTLCache[str, int] = TTLCache(max_size=8, ttl_seconds=60.0)
+    calls = []
+
+    async def load():
+        calls.append(1)
+
+    assert await cache.get_or_load("a", load) is None
+    assert await cache.get_or_load("a", load) is None
+    assert len(calls) == 2
+
+
+async def test_ttl_cache_shares_load_exception_with_waiters():
+    cache: TTLCache[str, int] = TTLCache(max_size=8, ttl_seconds=60.0)
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise LookupError("missing")
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("a", load) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, LookupError) for r in results)
+
+
+async def test_ttl_cache_leader_cancellation_hands_load_to_waiter():
+    """Cancelling the caller running the load must not cancel callers waiting on it."""
+    cache: TTLCache[str, int] = TTLCache(max_size=8, ttl_seconds=60.0)
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    leader = asyncio.ensure_future(cache.get_or_load("a", load))
+    await asyncio.sleep(0)
+    waiters = [asyncio.ensure_future(cache.get_or_load("a", load)) for _ in range(2)]
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await asyncio.gather(*waiters) == [42, 42]
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert len(calls) == 2
+    assert cache.get("a") == 42
+
+
+async def test_ttl_cache_waiter_cancellation_does_not_cancel_load():
+    cache: TTLCache[str, int] = TTLCache(max_size=8, ttl_seconds=60.0)
+
+    async def load():
+        await asyncio.sleep(0.01)
+        return 7
+
+    leader = asyncio.ensure_future(cache.get_or_load("a", load))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(cache.get_or_load("a", load))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    assert await leader == 7
+    assert waiter.cancelled()
+
+
+async def test_ttl_cache_discard_during_load_skips_caching():
+    cache: TTLCache[tuple[str, str], int] = TTLCache(max_size=8, ttl_seconds=60.0)
+
+    async def load():
+        await asyncio.sleep(0.01)
+        return 1
+
+    pending = asyncio.ensure_future(cache.get_or_load(("m", "1"), load))
+    await asyncio.sleep(0)
+    cache.discard_where(lambda key: key[0] == "m")
+    assert await pending == 1
+    assert cache.get(("m", "1")) is None
@@ -29,6 +29,15 @@ from app.domain.validators.event_validator import (
     validate_tenant_id,
 )
 
+# Fixed timestamp shared by all events in this module; tests never depend on wall time.
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _msg(exc_info: pytest.ExceptionInfo) -> str:
+    """Error message materialized once; domain errors carry it as .message."""
+    return getattr(exc_info.value, "message", None) or str(exc_info.value)
+
+
 # --- validate_tenant_id ---
 
 
@@ -42,10 +51,8 @@ def test_validate_tenant_id_rejects_empty():
     """Empty or whitespace-only tenant_id raises InvalidTenantError."""
     with pytest.raises(InvalidTenantError) as exc_info:
         validate_tenant_id("")
-    assert (
-        "empty" in exc_info.value.message.lower()
-        or "must not" in exc_info.value.message
-    )
+    msg = _msg(exc_info)
+    assert "empty" in msg.lower() or "must not" in msg
 
     with pytest.raises(InvalidTenantError):
         validate_tenant_id("   ")
@@ -70,7 +77,7 @@ def test_validate_risk_score_rejects_out_of_bounds(score: float):
     """Scores outside [0, 100] raise RiskThresholdViolationError."""
     with pytest.raises(RiskThresholdViolationError) as exc_info:
         validate_risk_score(score)
-    msg = str(exc_info.value)
+    msg = _msg(exc_info)
     assert "0" in msg or str(RISK_SCORE_MIN) in msg
     assert "100" in msg or str(RISK_SCORE_MAX) in msg
 
@@ -92,7 +99,22 @@ def test_validate_metadata_rejects_non_serializable():
     """Non-JSON-serializable value raises InvalidMetadataError."""
     with pytest.raises(InvalidMetadataError) as exc_info:
         validate_metadata_json_serializable({"bad": object()})
-    assert "JSON-serializable" in exc_info.value.message
+    assert "JSON-serializable" in _msg(exc_info)
+
+
+def test_validate_metadata_matches_json_dumps_semantics():
+    """Nested containers and scalar dict keys pass; nested bad values and cycles fail."""
+    validate_metadata_json_serializable(
+        {"n": {"t": (1, 2.5, None), 1: True}, "l": [{"x": "y"}]}
+    )
+    with pytest.raises(InvalidMetadataError):
+        validate_metadata_json_serializable({"n": [{"bad": {1, 2}}]})
+    with pytest.raises(InvalidMetadataError):
+        validate_metadata_json_serializable({(1, 2): "tuple key"})
+    cyclic: dict = {}
+    cyclic["self"] = cyclic
+    with pytest.raises(InvalidMetadataError):
+        validate_metadata_json_serializable(cyclic)
 
 
 # --- validate_status_transition ---
@@ -115,8 +137,9 @@ def test_validate_status_transition_invalid_raises():
     """Invalid transition raises InvalidStatusTransitionError."""
     with pytest.raises(InvalidStatusTransitionError) as exc_info:
         validate_status_transition(EventStatus.RECEIVED, EventStatus.APPROVED)
-    assert EventStatus.RECEIVED.value in str(exc_info.value)
-    assert EventStatus.APPROVED.value in str(exc_info.value)
+    msg = _msg(exc_info)
+    assert EventStatus.RECEIVED.value in msg
+    assert EventStatus.APPROVED.value in msg
 
 
 # --- validate_risk_event_create_request ---
@@ -158,7 +181,7 @@ def test_validate_risk_event_create_request_empty_version_raises():
     )
     with pytest.raises(DomainValidationError) as exc_info:
         validate_risk_event_create_request(req)
-    assert "version" in exc_info.value.message.lower()
+    assert "version" in _msg(exc_info).lower()
 
 
 # --- validate_compliance_event_create_request ---
@@ -179,7 +202,7 @@ def test_validate_compliance_event_create_request_empty_version_raises():
     req = ComplianceEventCreateRequest(tenant_id="t1", version="  ")
     with pytest.raises(DomainValidationError) as exc_info:
         validate_compliance_event_create_request(req)
-    assert "version" in exc_info.value.message.lower()
+    assert "version" in _msg(exc_info).lower()
 
 
 # --- validate_risk_event (entity) ---
@@ -191,7 +214,7 @@ def test_validate_risk_event_entity_happy():
         event_id="e1",
         tenant_id="t1",
         status=EventStatus.CREATED,
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
         risk_score=50.0,
     )
     validate_risk_event(ev)
@@ -203,7 +226,7 @@ def test_validate_risk_event_entity_empty_tenant_raises():
         event_id="e1",
         tenant_id="",
         status=EventStatus.CREATED,
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
     )
     with pytest.raises(InvalidTenantError):
         validate_risk_event(ev)
@@ -215,7 +238,7 @@ def test_validate_risk_event_entity_invalid_score_raises():
         event_id="e1",
         tenant_id="t1",
         status=EventStatus.CREATED,
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
         risk_score=200.0,
     )
     with pytest.raises(RiskThresholdViolationError):
@@ -231,7 +254,7 @@ def test_validate_compliance_event_entity_happy():
         event_id="e1",
         tenant_id="t1",
         status=EventStatus.CREATED,
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
     )
     validate_compliance_event(ev)
 
@@ -242,7 +265,7 @@ def test_validate_compliance_event_entity_empty_tenant_raises():
         event_id="e1",
         tenant_id="   ",
         status=EventStatus.CREATED,
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
     )
     with pytest.raises(InvalidTenantError):
         validate_compliance_event(ev)
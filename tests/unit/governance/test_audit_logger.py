@@ -5,8 +5,9 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.governance.audit_logger import AuditLogger
+from app.governance.audit_logger import AuditLogger, BufferedAuditLogger
 from app.governance.audit_models import AuditRecord
+from app.governance.exceptions import AuditBufferFullError
 
 
 @pytest.fixture
@@ -21,6 +22,29 @@ def audit_logger(audit_repository):
     return AuditLogger(repository=audit_repository)
 
 
+@pytest.fixture
+async def buffered_audit_logger(audit_repository):
+    audit_repository.save_many = AsyncMock(return_value=None)
+    buffered = BufferedAuditLogger(
+        repository=audit_repository, max_size=3, flush_interval_seconds=60.0
+    )
+    yield buffered
+    await buffered.close()
+
+
+async def _log(audit_logger, action: str = "test_action") -> None:
+    await audit_logger.log_action(
+        actor="user-1",
+        tenant_id="t1",
+        action=action,
+        resource_type="event",
+        resource_id="evt-1",
+        reason=None,
+        correlation_id="corr-1",
+        metadata=None,
+    )
+
+
 async def test_audit_immutability(audit_logger, audit_repository):
     """Audit record must not allow mutation; stored via repository."""
     await audit_logger.log_action(
@@ -70,3 +94,132 @@ async def test_audit_fields_completeness(audit_logger, audit_repository):
     d = record.to_dict()
     assert "timestamp_utc" in d
     assert "actor" in d and "action" in d and "reason" in d and "correlation_id" in d
+
+
+async def test_buffered_audit_defers_writes_until_flush(
+    buffered_audit_logger, audit_repository
+):
+    """Buffered logger holds records in-process; flush writes them as one batch."""
+    await _log(buffered_audit_logger, "a1")
+    await _log(buffered_audit_logger, "a2")
+    assert buffered_audit_logger.pending_count == 2
+    audit_repository.save_many.assert_not_awaited()
+    audit_repository.save.assert_not_awaited()
+
+    await buffered_audit_logger.flush()
+    assert buffered_audit_logger.pending_count == 0
+    batch = audit_repository.save_many.call_args[0][0]
+    assert [r.action for r in batch] == ["a1", "a2"]
+    assert all(r.timestamp_utc.tzinfo == timezone.utc for r in batch)
+
+
+async def test_buffered_audit_flushes_at_max_size(
+    buffered_audit_logger, audit_repository
+):
+    """Reaching max_size triggers an immediate batch write."""
+    for i in range(3):
+        await _log(buffered_audit_logger, f"a{i}")
+    assert audit_repository.save_many.await_count == 1
+    assert len(audit_repository.save_many.call_args[0][0]) == 3
+    assert buffered_audit_logger.pending_count == 0
+
+
+async def test_buffered_audit_close_flushes_pending(audit_repository):
+    """close() writes pending records so nothing is lost on shutdown."""
+    audit_repository.save_many = AsyncMock(return_value=None)
+    buffered = BufferedAuditLogger(repository=audit_repository, max_size=10)
+    await _log(buffered)
+    await buffered.close()
+    assert audit_repository.save_many.await_count == 1
+    assert buffered.pending_count == 0
+
+
+async def test_buffered_audit_failed_flush_keeps_records(audit_repository, caplog):
+    """A failed batch write keeps records queued for the next flush; it is logged, not raised."""
+    audit_repository.save_many = AsyncMock(side_effect=RuntimeError("db down"))
+    buffered = BufferedAuditLogger(repository=audit_repository, max_size=10)
+    await _log(buffered)
+    await buffered.flush()
+    assert buffered.pending_count == 1
+    assert "audit_buffer_flush_failed" in caplog.text
+    audit_repository.save_many = AsyncMock(return_value=None)
+    await buffered.close()
+    assert buffered.pending_count == 0
+
+
+async def test_buffered_audit_failed_size_flush_not_raised_or_retried_per_record(
+    audit_repository,
+):
+    """A failed size-triggered flush does not fail log_action, and the next records do not
+    retry the whole buffer until another max_size batch has accumulated."""
+    audit_repository.save_many = AsyncMock(side_effect=RuntimeError("db down"))
+    buffered = BufferedAuditLogger(repository=audit_repository, max_size=2)
+    try:
+        await _log(buffered, "a1")
+        await _log(buffered, "a2")
+        assert audit_repository.save_many.await_count == 1
+        await _log(buffered, "a3")
+        assert audit_repository.save_many.await_count == 1
+        audit_repository.save_many = AsyncMock(return_value=None)
+        await _log(buffered, "a4")
+        (batch,) = audit_repository.save_many.await_args.args
+        assert [r.action for r in batch] == ["a1", "a2", "a3", "a4"]
+        assert buffered.pending_count == 0
+    finally:
+        await buffered.close()
+
+
+async def test_buffered_audit_rejects_records_at_hard_cap(audit_repository):
+    """At max_pending the record is rejected with AuditBufferFullError and not kept."""
+    audit_repository.save_many = AsyncMock(side_effect=RuntimeError("db down"))
+    buffered = BufferedAuditLogger(
+        repository=audit_repository, max_size=2, max_pending=3
+    )
+    try:
+        for i in range(3):
+            await _log(buffered, f"a{i}")
+        with pytest.raises(AuditBufferFullError):
+            await _log(buffered, "rejected")
+        assert buffered.pending_count == 3
+    finally:
+        audit_repository.save_many = AsyncMock(return_value=None)
+        await buffered.close()
+    (batch,) = audit_repository.save_many.await_args.args
+    assert "rejected" not in [r.action for r in batch]
+
+
+class _SaveOnlyRepository:
+    """AuditRepository without save_many; save() fails from the fail_at-th record on."""
+
+    def __init__(self, fail_at: int | None = None) -> None:
+        self.saved: list[AuditRecord] = []
+        self.fail_at = fail_at
+
+    async def save(self, record: AuditRecord) -> None:
+        if self.fail_at is not None and len(self.saved) >= self.fail_at:
+            raise RuntimeError("db down")
+        self.saved.append(record)
+
+
+async def test_buffered_audit_falls_back_to_save_per_record():
+    """A repository without save_many is written with one save() per record, in order."""
+    repo = _SaveOnlyRepository()
+    buffered = BufferedAuditLogger(repository=repo, max_size=2)
+    await _log(buffered, "a1")
+    await _log(buffered, "a2")
+    assert [r.action for r in repo.saved] == ["a1", "a2"]
+    await buffered.close()
+
+
+async def test_buffered_audit_save_fallback_requeues_only_unsaved(caplog):
+    """If save() fails mid-batch, records already written are not written again."""
+    repo = _SaveOnlyRepository(fail_at=1)
+    buffered = BufferedAuditLogger(repository=repo, max_size=10)
+    for action in ("a1", "a2", "a3"):
+        await _log(buffered, action)
+    await buffered.flush()
+    assert buffered.pending_count == 2
+    assert "audit_buffer_flush_failed" in caplog.text
+    repo.fail_at = None
+    await buffered.close()
+    assert [r.action for r in repo.saved] == ["a1", "a2", "a3"]
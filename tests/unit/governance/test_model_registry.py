@@ -1,5 +1,7 @@
 """Governance tests: model cannot be approved twice; cannot deploy unapproved model."""
 
+import asyncio
+from collections import defaultdict
 from unittest.mock import AsyncMock
 
 import pytest
@@ -11,15 +13,15 @@ from app.governance.model_registry import ModelRegistry, ModelRecord, ModelStatu
 @pytest.fixture
 def model_repo():
     repo = AsyncMock()
-    store: dict[tuple[str, str], ModelRecord] = {}
+    store: dict[str, dict[str, ModelRecord]] = defaultdict(dict)
     latest: dict[str, ModelRecord] = {}
 
     async def save(r: ModelRecord) -> None:
-        store[(r.model_name, r.version)] = r
+        store[r.model_name][r.version] = r
         latest[r.model_name] = r
 
     async def get(name: str, version: str):
-        return store.get((name, version))
+        return store.get(name, {}).get(version)
 
     async def get_latest(name: str):
         return latest.get(name)
@@ -140,3 +142,117 @@ async def test_get_approved_model_succeeds_when_approved(model_registry):
     r = await model_registry.get_approved_model("m1", "1.0")
     assert r.is_deployable()
     assert r.status == ModelStatus.APPROVED
+
+
+async def test_get_approved_model_cached_until_registry_write(
+    model_registry, model_repo
+):
+    """Approved lookups are served from cache; a write to the model invalidates it."""
+    await model_registry.register_model(
+        model_name="m1",
+        version="1.0",
+        checksum="x",
+        correlation_id="c1",
+        tenant_id="t1",
+    )
+    await model_registry.approve_model(
+        model_name="m1",
+        version="1.0",
+        approved_by="admin",
+        tenant_id="t1",
+        correlation_id="c1",
+    )
+    repo_get_latest = model_repo.get_latest
+    calls = []
+
+    async def counting_get_latest(name: str):
+        calls.append(name)
+        return await repo_get_latest(name)
+
+    model_repo.get_latest = counting_get_latest
+    await model_registry.get_approved_model("m1")
+    await model_registry.get_approved_model("m1")
+    assert calls == ["m1"]
+
+    await model_registry.register_model(
+        model_name="m1",
+        version="2.0",
+        checksum="y",
+        correlation_id="c2",
+        tenant_id="t1",
+    )
+    with pytest.raises(ModelNotApprovedError):
+        await model_registry.get_approved_model("m1")
+    assert calls == ["m1", "m1"]
+
+
+async def test_get_approved_model_does_not_cache_rejection(model_repo, audit_logger):
+    """Negative results are never cached; zero TTL disables caching entirely."""
+    registry = ModelRegistry(
+        repository=model_repo, audit_logger=audit_logger, approval_cache_ttl_seconds=0
+    )
+    await registry.register_model(
+        model_name="m1",
+        version="1.0",
+        checksum="x",
+        correlation_id="c1",
+        tenant_id="t1",
+    )
+    with pytest.raises(ModelNotApprovedError):
+        await registry.get_approved_model("m1", "1.0")
+    await registry.approve_model(
+        model_name="m1",
+        version="1.0",
+        approved_by="admin",
+        tenant_id="t1",
+        correlation_id="c1",
+    )
+    assert (await registry.get_approved_model("m1", "1.0")).is_deployable()
+
+
+async def test_get_approved_model_single_flight(model_repo, model_registry):
+    """Concurrent misses share one repository lookup; a write during the lookup is not cached."""
+    await model_registry.register_model(
+        model_name="m1",
+        version="1.0",
+        checksum="x",
+        correlation_id="c1",
+        tenant_id="t1",
+    )
+    await model_registry.approve_model(
+        model_name="m1",
+        version="1.0",
+        approved_by="admin",
+        tenant_id="t1",
+        correlation_id="c1",
+    )
+    repo_get_latest = model_repo.get_latest
+    calls = []
+
+    async def slow_get_latest(name: str):
+        calls.append(name)
+        record = await repo_get_latest(name)
+        await asyncio.sleep(0.01)
+        return record
+
+    model_repo.get_latest = slow_get_latest
+    records = await asyncio.gather(
+        *(model_registry.get_approved_model("m1") for _ in range(3))
+    )
+    assert calls == ["m1"]
+    assert all(r is records[0] for r in records)
+
+    # Invalidate (via a write) while a lookup is in flight: its result must not be cached.
+    model_registry._approved_cache.invalidate("m1")
+    lookup = asyncio.ensure_future(model_registry.get_approved_model("m1"))
+    await asyncio.sleep(0)
+    await model_registry.register_model(
+        model_name="m1",
+        version="2.0",
+        checksum="y",
+        correlation_id="c2",
+        tenant_id="t1",
+    )
+    assert (await lookup).version == "1.0"
+    with pytest.raises(ModelNotApprovedError):
+        await model_registry.get_approved_model("m1")
@@ -127,3 +127,26 @@ async def test_get_approved_prompt_returns_record_when_found(prompt_registry):
     assert record.prompt_id == "p1"
     assert record.version == 1
     assert record.content == "Hello"
+
+
+async def test_get_approved_prompt_cache_invalidated_on_update(prompt_registry):
+    """Cached latest prompt is dropped when a new version is written."""
+    await prompt_registry.register_prompt(
+        prompt_id="p1",
+        name="Prompt 1",
+        content="Hello",
+        change_reason="initial",
+        author="alice",
+        tenant_id="t1",
+        correlation_id="c1",
+    )
+    assert (await prompt_registry.get_approved_prompt("p1")).version == 1
+    await prompt_registry.update_prompt(
+        prompt_id="p1",
+        content="Hello v2",
+        change_reason="update",
+        author="bob",
+        tenant_id="t1",
+        correlation_id="c2",
+    )
+    assert (await prompt_registry.get_approved_prompt("p1")).version == 2
@@ -0,0 +1,39 @@
+"""Governance tests: GOVERNANCE_VIOLATION record per rejected gate."""
+
+import pytest
+
+from app.governance.exceptions import ModelNotApprovedError, PromptNotApprovedError
+from app.governance.violations import (
+    GOVERNANCE_VIOLATION_ACTION,
+    log_governance_violation,
+)
+
+
+@pytest.mark.parametrize(
+    ("error", "target"),
+    [
+        (ModelNotApprovedError("model rejected"), ("model", "m")),
+        (PromptNotApprovedError("prompt rejected"), ("prompt", "p")),
+    ],
+)
+async def test_log_governance_violation_targets_rejected_gate(
+    spy_audit_logger, error, target
+):
+    await log_governance_violation(
+        spy_audit_logger,
+        error,
+        model_name="m",
+        prompt_name="p",
+        tenant_id="t1",
+        correlation_id="c1",
+        event_id="e1",
+    )
+    (action,) = spy_audit_logger.actions
+    assert action["action"] == GOVERNANCE_VIOLATION_ACTION
+    assert (action["resource_type"], action["resource_id"]) == target
+    assert action["reason"] == error.message
+    assert action["metadata"] == {
+        "exception_type": type(error).__name__,
+        "event_id": "e1",
+    }
+    assert spy_audit_logger.flush_count == 1
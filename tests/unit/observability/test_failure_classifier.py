@@ -2,13 +2,14 @@
 
 from app.application.exceptions import IdempotencyConflictError
 from app.domain.exceptions import (
+    DomainError,
     DomainValidationError,
     InvalidTenantError,
     RiskThresholdViolationError,
 )
 from app.governance.exceptions import ModelNotApprovedError, PromptNotApprovedError
 from app.observability.failure_classifier import FailureCategory, FailureClassifier
-from app.security.exceptions import AuthorizationError
+from app.security.exceptions import AuthorizationError, EncryptionError
 
 
 def test_classify_validation_error():
@@ -64,3 +65,23 @@ def test_classify_unknown_exception_unexpected():
         FailureClassifier.classify(RuntimeError("x"))
         == FailureCategory.UNEXPECTED_ERROR
     )
+
+
+def test_classify_subclass_resolves_most_specific_base():
+    """Unregistered subclasses classify via their nearest registered base."""
+
+    class CustomDomainError(DomainError):
+        pass
+
+    class CustomEncryptionError(EncryptionError):
+        pass
+
+    for _ in range(2):  # second pass hits the memoized entry
+        assert (
+            FailureClassifier.classify(CustomDomainError("x"))
+            == FailureCategory.VALIDATION_ERROR
+        )
+        assert (
+            FailureClassifier.classify(CustomEncryptionError("x"))
+            == FailureCategory.INFRA_ERROR
+        )
@@ -51,6 +51,9 @@ def test_metrics_failure_count_by_category():
     assert "failure_count" in out["counters_by_labels"]
     labels = out["counters_by_labels"]["failure_count"]
     assert sum(labels.values()) == 3
+    assert m.get_counter("failure_count", category="VALIDATION_ERROR") == 2
+    assert m.get_counter("failure_count", category="WORKFLOW_ERROR") == 1
+    assert m.get_counter("failure_count", category="INFRA_ERROR") == 0
 
 
 def test_metrics_observe_latency_with_node_label():
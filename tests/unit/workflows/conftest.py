@@ -1,12 +1,20 @@
 """Fixtures for workflow tests."""
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
 import pytest
 
 from app.governance.audit_logger import AuditLogger
+from app.governance.model_registry import ModelRecord, ModelRegistry, ModelStatus
+from app.governance.prompt_registry import PromptRecord, PromptRegistry
 from app.workflows.langgraph.state_models import ComplianceState, RiskState
 
+WorkflowState = RiskState | ComplianceState
+
 
 def _base_risk_state(
     event_id: str = "evt-1",
@@ -30,32 +38,141 @@ def _base_compliance_state(
     tenant_id: str = "t1",
     correlation_id: str = "corr-1",
     raw_event: dict | None = None,
-    regulatory_flags: list | None = None,
+    regulatory_flags: tuple[str, ...] = (),
 ) -> ComplianceState:
     return ComplianceState(
         event_id=event_id,
         tenant_id=tenant_id,
         correlation_id=correlation_id,
         raw_event=raw_event or {"event_type": "standard"},
-        regulatory_flags=regulatory_flags or [],
+        regulatory_flags=regulatory_flags,
         model_version="simulated@1",
         prompt_version=1,
         audit_trail=[],
     )
 
 
-@pytest.fixture
+class _InMemoryModelRepository:
+    """Plain async ModelRegistryRepository over nested dicts (no mock machinery)."""
+
+    def __init__(self, records: tuple[ModelRecord, ...] = ()) -> None:
+        self._store: dict[str, dict[str, ModelRecord]] = defaultdict(dict)
+        self._latest: dict[str, ModelRecord] = {}
+        for record in records:
+            self._store[record.model_name][record.version] = record
+            self._latest[record.model_name] = record
+
+    async def save(self, record: ModelRecord) -> None:
+        self._store[record.model_name][record.version] = record
+        self._latest[record.model_name] = record
+
+    async def get(self, model_name: str, version: str) -> ModelRecord | None:
+        return self._store.get(model_name, {}).get(version)
+
+    async def get_latest(self, model_name: str) -> ModelRecord | None:
+        return self._latest.get(model_name)
+
+
+class _EmptyPromptRepository:
+    """PromptRegistryRepository with no prompts: every lookup misses."""
+
+    async def save(self, record: PromptRecord) -> None:
+        pass
+
+    async def get(
+        self, prompt_id: str, version: int | None = None
+    ) -> PromptRecord | None:
+        return None
+
+    async def get_versions(self, prompt_id: str) -> list[PromptRecord]:
+        return []
+
+
+class _FakeStateStore:
+    """Hand-rolled async WorkflowStateStore: returns `cached` and records calls."""
+
+    def __init__(self, cached: WorkflowState | None = None, delay: float = 0.0) -> None:
+        self.cached = cached
+        self.delay = delay
+        self.get_calls: list[str] = []
+        self.set_calls: list[tuple[str, WorkflowState]] = []
+
+    async def _get(self, event_id: str) -> WorkflowState | None:
+        self.get_calls.append(event_id)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.cached
+
+    async def get_risk_state(self, event_id: str) -> WorkflowState | None:
+        return await self._get(event_id)
+
+    async def set_risk_state(self, event_id: str, state: WorkflowState) -> None:
+        self.set_calls.append((event_id, state))
+
+    async def get_compliance_state(self, event_id: str) -> WorkflowState | None:
+        return await self._get(event_id)
+
+    async def set_compliance_state(self, event_id: str, state: WorkflowState) -> None:
+        self.set_calls.append((event_id, state))
+
+
+def _pending_model(model_name: str) -> ModelRecord:
+    return ModelRecord(
+        model_name=model_name,
+        version="1.0",
+        checksum="x",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        approved=False,
+        approved_by=None,
+        approved_at=None,
+        status=ModelStatus.PENDING,
+    )
+
+
+@pytest.fixture(scope="module")
+def unapproved_model_registry():
+    """Registry where risk-model and compliance-model are registered but not approved.
+    Module-scoped: rejections are never cached, so sharing it across tests is safe.
+    Tests must not register or approve through it."""
+    repo = _InMemoryModelRepository(
+        (_pending_model("risk-model"), _pending_model("compliance-model"))
+    )
+    return ModelRegistry(repository=repo, audit_logger=AsyncMock())
+
+
+@pytest.fixture(scope="module")
+def unapproved_prompt_registry():
+    """Registry with no prompts: every get_approved_prompt raises PromptNotApprovedError."""
+    return PromptRegistry(repository=_EmptyPromptRepository(), audit_logger=AsyncMock())
+
+
+@pytest.fixture(scope="module")
 def audit_repository():
+    """Shared per module; call history is cleared before every test (see below)."""
     repo = AsyncMock()
     repo.save = AsyncMock(return_value=None)
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_audit_repository(audit_repository):
+    # Also drop side_effect/return_value a test may have set (e.g. a failing save).
+    audit_repository.reset_mock(return_value=True, side_effect=True)
+    audit_repository.save.return_value = None
+
+
+@pytest.fixture(scope="module")
 def audit_logger(audit_repository):
+    """AuditLogger holds no state besides its repository, so one per module suffices."""
     return AuditLogger(repository=audit_repository)
 
 
+@pytest.fixture
+def make_state_store() -> Callable[..., _FakeStateStore]:
+    """Factory for fake state stores: make_state_store(cached=..., delay=...)."""
+    return _FakeStateStore
+
+
 @pytest.fixture
 def risk_state():
     return _base_risk_state()
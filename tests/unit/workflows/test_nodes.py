@@ -4,7 +4,10 @@ import pytest
 
 from app.workflows.langgraph.nodes.decision import make_decision
 from app.workflows.langgraph.nodes.guardrails import apply_guardrails
-from app.workflows.langgraph.nodes.policy_validation import validate_policy
+from app.workflows.langgraph.nodes.policy_validation import (
+    evaluate_policy,
+    validate_policy,
+)
 from app.workflows.langgraph.nodes.retrieval import retrieve_context
 from app.workflows.langgraph.nodes.risk_scoring import score_risk
 from app.workflows.langgraph.state_models import RiskState
@@ -30,6 +33,19 @@ async def test_retrieval_valid_state_correct_transformation(audit_logger):
     assert out.audit_trail[0]["prompt_version"] == 2
 
 
+@pytest.mark.asyncio
+async def test_retrieval_non_string_event_type(audit_logger):
+    """Client-supplied event_type may be any JSON value; retrieval must not require a str."""
+    state = RiskState(
+        event_id="e1",
+        tenant_id="t1",
+        correlation_id="c1",
+        raw_event={"event_type": ["x"]},
+    )
+    out = await retrieve_context(state, audit_logger=audit_logger)
+    assert out.retrieved_context == "simulated_context:t1:['x']"
+
+
 @pytest.mark.asyncio
 async def test_retrieval_audit_emitted(audit_logger, audit_repository):
     state = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1", raw_event={})
@@ -68,6 +84,22 @@ async def test_policy_validation_fail_sensitive(audit_logger):
     assert out.policy_result == "FAIL"
 
 
+@pytest.mark.parametrize(
+    ("raw_event", "expected"),
+    [
+        ({}, "PASS"),
+        ({"metadata": None}, "PASS"),
+        ({"metadata": {"category": "normal"}}, "PASS"),
+        ({"metadata": {"category": "sensitive"}}, "FAIL"),
+        ({"metadata": {"policy_override": True}}, "FAIL"),
+        ({"metadata": {"category": ["a"]}}, "PASS"),
+        ({"metadata": {"category": {}}}, "PASS"),
+    ],
+)
+def test_evaluate_policy(raw_event, expected):
+    assert evaluate_policy(raw_event) == expected
+
+
 @pytest.mark.asyncio
 async def test_policy_validation_audit_emitted(audit_logger, audit_repository):
     state = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1", raw_event={})
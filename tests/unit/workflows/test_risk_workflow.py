@@ -1,12 +1,14 @@
 """Risk workflow tests: happy path, policy fail, high risk, idempotency, audit trail."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
+from app.governance.audit_logger import BufferedAuditLogger
 from app.governance.exceptions import ModelNotApprovedError
-from app.governance.model_registry import ModelRegistry, ModelRecord
-from app.workflows.langgraph.risk_workflow import RiskWorkflow
+from app.governance.model_registry import ModelRegistry
+from app.workflows.langgraph.risk_workflow import NODE_ORDER, RiskWorkflow
 from app.workflows.langgraph.state_models import RiskState
 
 
@@ -62,7 +64,7 @@ async def test_risk_workflow_high_risk_triggers_approval(audit_logger):
 
 
 @pytest.mark.asyncio
-async def test_risk_workflow_idempotency_skip(audit_logger):
+async def test_risk_workflow_idempotency_skip(audit_logger, make_state_store):
     """If state_store returns cached state, workflow must return it without re-running nodes."""
     cached_state = RiskState(
         event_id="e4",
@@ -72,9 +74,7 @@ async def test_risk_workflow_idempotency_skip(audit_logger):
         risk_score=20.0,
         audit_trail=[{"node": "decision", "action": "decision_made"}],
     )
-    store = AsyncMock()
-    store.get_risk_state = AsyncMock(return_value=cached_state)
-    store.set_risk_state = AsyncMock(return_value=None)
+    store = make_state_store(cached=cached_state)
     workflow = RiskWorkflow(audit_logger=audit_logger, state_store=store)
     state = RiskState(
         event_id="e4",
@@ -86,8 +86,121 @@ async def test_risk_workflow_idempotency_skip(audit_logger):
     out = await workflow.run(state)
     assert out.final_decision == "APPROVED"
     assert out.risk_score == 20.0
-    store.get_risk_state.assert_awaited_once_with("e4")
-    store.set_risk_state.assert_not_awaited()
+    assert store.get_calls == ["e4"]
+    assert store.set_calls == []
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_caller_terminal_state_still_gated(
+    audit_logger, audit_repository, unapproved_model_registry, make_state_store
+):
+    """A caller-built state whose trail shows a decision is not trusted: the gate still runs."""
+    store = make_state_store()
+    workflow = RiskWorkflow(
+        audit_logger=audit_logger,
+        state_store=store,
+        model_registry=unapproved_model_registry,
+    )
+    state = RiskState(
+        event_id="e4t",
+        tenant_id="t1",
+        correlation_id="c4t",
+        final_decision="APPROVED",
+        audit_trail=[{"node": "decision", "action": "decision_made"}],
+    )
+    with pytest.raises(ModelNotApprovedError):
+        await workflow.run(state)
+    assert store.set_calls == []
+    (record,) = [c.args[0] for c in audit_repository.save.await_args_list]
+    assert record.action == "GOVERNANCE_VIOLATION"
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_stored_terminal_state_returned_without_gate(
+    audit_logger, audit_repository, unapproved_model_registry, make_state_store
+):
+    """Only a state loaded from the store short-circuits; it was gated when first run."""
+    stored = RiskState(
+        event_id="e4s",
+        tenant_id="t1",
+        correlation_id="c4s",
+        final_decision="APPROVED",
+        audit_trail=[{"node": "decision", "action": "decision_made"}],
+    )
+    store = make_state_store(cached=stored)
+    workflow = RiskWorkflow(
+        audit_logger=audit_logger,
+        state_store=store,
+        model_registry=unapproved_model_registry,
+    )
+    state = RiskState(event_id="e4s", tenant_id="t1", correlation_id="c4s")
+    assert await workflow.run(state) is stored
+    assert audit_repository.save.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_final_decision_without_decision_node_still_runs(
+    audit_logger,
+):
+    """final_decision alone is not terminal: the audit trail must show the decision node."""
+    workflow = RiskWorkflow(audit_logger=audit_logger, state_store=None)
+    state = RiskState(
+        event_id="e4u",
+        tenant_id="t1",
+        correlation_id="c4u",
+        raw_event={"event_type": "high_risk"},
+        final_decision="APPROVED",
+    )
+    out = await workflow.run(state)
+    assert out.final_decision == "REQUIRE_APPROVAL"
+    assert [e["node"] for e in out.audit_trail] == NODE_ORDER
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_concurrent_replays_share_one_store_read(
+    audit_logger, make_state_store
+):
+    """Concurrent runs for the same event coalesce into one get_risk_state; later runs hit cache."""
+    cached_state = RiskState(
+        event_id="e4c",
+        tenant_id="t1",
+        correlation_id="c4c",
+        final_decision="APPROVED",
+        audit_trail=[{"node": "decision", "action": "decision_made"}],
+    )
+
+    store = make_state_store(cached=cached_state, delay=0.01)
+    workflow = RiskWorkflow(audit_logger=audit_logger, state_store=store)
+    state = RiskState(event_id="e4c", tenant_id="t1", correlation_id="c4c")
+    outs = await asyncio.gather(*(workflow.run(state) for _ in range(3)))
+    outs.append(await workflow.run(state))
+    assert all(out is cached_state for out in outs)
+    assert store.get_calls == ["e4c"]
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_cancelled_replay_does_not_cancel_waiters(
+    audit_logger, make_state_store
+):
+    """If the run leading a shared store read is cancelled, a waiting run retries the read."""
+    cached_state = RiskState(
+        event_id="e4x",
+        tenant_id="t1",
+        correlation_id="c4x",
+        final_decision="APPROVED",
+        audit_trail=[{"node": "decision", "action": "decision_made"}],
+    )
+    store = make_state_store(cached=cached_state, delay=0.01)
+    workflow = RiskWorkflow(audit_logger=audit_logger, state_store=store)
+    state = RiskState(event_id="e4x", tenant_id="t1", correlation_id="c4x")
+    leader = asyncio.ensure_future(workflow.run(state))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(workflow.run(state))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await waiter is cached_state
+    assert leader.cancelled()
+    assert store.get_calls == ["e4x", "e4x"]
 
 
 @pytest.mark.asyncio
@@ -109,14 +222,36 @@ async def test_risk_workflow_audit_trail_length(audit_logger):
     assert "guardrails" in nodes_in_trail
     assert "decision" in nodes_in_trail
     assert len(out.audit_trail) == 5
+    # Fan-out nodes run concurrently but are joined in NODE_ORDER.
+    assert nodes_in_trail == NODE_ORDER
 
 
 @pytest.mark.asyncio
-async def test_risk_workflow_stores_result_when_store_provided(audit_logger):
+async def test_risk_workflow_fan_out_skips_completed_nodes(
+    audit_logger, audit_repository
+):
+    """Fan-out nodes already in audit_trail are not re-run; their fields are kept."""
+    workflow = RiskWorkflow(audit_logger=audit_logger, state_store=None)
+    state = RiskState(
+        event_id="e5r",
+        tenant_id="t1",
+        correlation_id="c5r",
+        raw_event={"event_type": "standard"},
+        retrieved_context="resumed",
+        audit_trail=[{"node": "retrieval"}],
+    )
+    out = await workflow.run(state)
+    assert out.retrieved_context == "resumed"
+    assert [e["node"] for e in out.audit_trail] == NODE_ORDER
+    assert audit_repository.save.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_stores_result_when_store_provided(
+    audit_logger, make_state_store
+):
     """When state_store is provided, final state must be stored after run."""
-    store = AsyncMock()
-    store.get_risk_state = AsyncMock(return_value=None)
-    store.set_risk_state = AsyncMock(return_value=None)
+    store = make_state_store()
     workflow = RiskWorkflow(audit_logger=audit_logger, state_store=store)
     state = RiskState(
         event_id="e6",
@@ -126,49 +261,37 @@ async def test_risk_workflow_stores_result_when_store_provided(audit_logger):
         audit_trail=[],
     )
     out = await workflow.run(state)
-    store.set_risk_state.assert_awaited_once()
-    call_args = store.set_risk_state.call_args
-    assert call_args[0][0] == "e6"
-    assert call_args[0][1].event_id == "e6"
-    assert call_args[0][1].final_decision == out.final_decision
+    assert store.set_calls == [("e6", out)]
+    assert out.event_id == "e6"
 
 
 @pytest.mark.asyncio
-async def test_risk_workflow_fails_when_model_registered_but_not_approved(audit_logger):
-    """When model_registry is provided and model is registered but not approved, run raises ModelNotApprovedError."""
-    store: dict[tuple[str, str], ModelRecord] = {}
-    latest: dict[str, ModelRecord] = {}
-
-    async def save(r: ModelRecord) -> None:
-        store[(r.model_name, r.version)] = r
-        latest[r.model_name] = r
-
-    async def get(name: str, version: str):
-        return store.get((name, version))
-
-    async def get_latest(name: str):
-        return latest.get(name)
-
-    repo = AsyncMock()
-    repo.save = save
-    repo.get = get
-    repo.get_latest = get_latest
-
-    audit = AsyncMock()
-    audit.log_action = AsyncMock(return_value=None)
-
-    registry = ModelRegistry(repository=repo, audit_logger=audit)
-    await registry.register_model(
-        model_name="risk-model",
-        version="1.0",
-        checksum="abc",
-        correlation_id="c1",
+async def test_risk_workflow_rewrites_state_after_store_miss(
+    audit_logger, make_state_store
+):
+    """A replay that misses the store (e.g. expired key) must persist again, never skip."""
+    store = make_state_store()
+    state = RiskState(
+        event_id="e6r",
         tenant_id="t1",
+        correlation_id="c6r",
+        raw_event={"event_type": "standard"},
     )
+    first = await RiskWorkflow(audit_logger=audit_logger, state_store=store).run(state)
+    second = await RiskWorkflow(audit_logger=audit_logger, state_store=store).run(state)
+    assert store.get_calls == ["e6r", "e6r"]
+    assert store.set_calls == [("e6r", first), ("e6r", second)]
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_fails_when_model_registered_but_not_approved(
+    audit_logger, unapproved_model_registry
+):
+    """When model_registry is provided and model is registered but not approved, run raises ModelNotApprovedError."""
     workflow = RiskWorkflow(
         audit_logger=audit_logger,
         state_store=None,
-        model_registry=registry,
+        model_registry=unapproved_model_registry,
     )
     state = RiskState(
         event_id="e7",
@@ -186,44 +309,14 @@ async def test_risk_workflow_fails_when_model_registered_but_not_approved(audit_
 
 @pytest.mark.asyncio
 async def test_risk_workflow_model_not_approved_emits_governance_violation_audit(
-    audit_logger,
+    unapproved_model_registry, spy_audit_logger
 ):
     """When model is not approved, workflow logs GOVERNANCE_VIOLATION before raising."""
-    from app.governance.model_registry import ModelRegistry, ModelRecord
-
-    store = {}
-    latest = {}
-
-    async def save(r: ModelRecord) -> None:
-        store[(r.model_name, r.version)] = r
-        latest[r.model_name] = r
-
-    async def get(name: str, version: str):
-        return store.get((name, version))
-
-    async def get_latest(name: str):
-        return latest.get(name)
-
-    repo = AsyncMock()
-    repo.save = save
-    repo.get = get
-    repo.get_latest = get_latest
-    registry_audit = AsyncMock()
-    registry_audit.log_action = AsyncMock(return_value=None)
-    registry = ModelRegistry(repository=repo, audit_logger=registry_audit)
-    await registry.register_model(
-        model_name="risk-model",
-        version="1.0",
-        checksum="x",
-        correlation_id="c1",
-        tenant_id="t1",
-    )
-    workflow_audit = AsyncMock()
-    workflow_audit.log_action = AsyncMock(return_value=None)
+    workflow_audit = spy_audit_logger
     workflow = RiskWorkflow(
         audit_logger=workflow_audit,
         state_store=None,
-        model_registry=registry,
+        model_registry=unapproved_model_registry,
     )
     state = RiskState(
         event_id="e7b",
@@ -234,8 +327,7 @@ async def test_risk_workflow_model_not_approved_emits_governance_violation_audit
     )
     with pytest.raises(ModelNotApprovedError):
         await workflow.run(state)
-    workflow_audit.log_action.assert_awaited_once()
-    call_kw = workflow_audit.log_action.call_args[1]
+    (call_kw,) = workflow_audit.actions
     assert call_kw["action"] == "GOVERNANCE_VIOLATION"
     assert call_kw["tenant_id"] == "t1"
     assert call_kw["correlation_id"] == "c7b"
@@ -247,24 +339,16 @@ async def test_risk_workflow_model_not_approved_emits_governance_violation_audit
 
 
 @pytest.mark.asyncio
-async def test_risk_workflow_prompt_not_approved_blocks_execution(audit_logger):
+async def test_risk_workflow_prompt_not_approved_blocks_execution(
+    audit_logger, unapproved_prompt_registry
+):
     """When prompt_registry is provided and prompt is not found, run raises PromptNotApprovedError."""
     from app.governance.exceptions import PromptNotApprovedError
-    from app.governance.prompt_registry import PromptRegistry
 
-    prompt_repo = AsyncMock()
-    prompt_repo.get = AsyncMock(return_value=None)
-    prompt_repo.get_versions = AsyncMock(return_value=[])
-    prompt_audit = AsyncMock()
-    prompt_audit.log_action = AsyncMock(return_value=None)
-    prompt_registry = PromptRegistry(
-        repository=prompt_repo,
-        audit_logger=prompt_audit,
-    )
     workflow = RiskWorkflow(
         audit_logger=audit_logger,
         state_store=None,
-        prompt_registry=prompt_registry,
+        prompt_registry=unapproved_prompt_registry,
     )
     state = RiskState(
         event_id="e8",
@@ -283,27 +367,16 @@ async def test_risk_workflow_prompt_not_approved_blocks_execution(audit_logger):
 
 @pytest.mark.asyncio
 async def test_risk_workflow_prompt_not_approved_emits_governance_violation_audit(
-    audit_logger,
+    unapproved_prompt_registry, spy_audit_logger
 ):
     """When prompt is not approved, workflow logs GOVERNANCE_VIOLATION before raising."""
     from app.governance.exceptions import PromptNotApprovedError
-    from app.governance.prompt_registry import PromptRegistry
 
-    prompt_repo = AsyncMock()
-    prompt_repo.get = AsyncMock(return_value=None)
-    prompt_repo.get_versions = AsyncMock(return_value=[])
-    prompt_audit = AsyncMock()
-    prompt_audit.log_action = AsyncMock(return_value=None)
-    prompt_registry = PromptRegistry(
-        repository=prompt_repo,
-        audit_logger=prompt_audit,
-    )
-    workflow_audit = AsyncMock()
-    workflow_audit.log_action = AsyncMock(return_value=None)
+    workflow_audit = spy_audit_logger
     workflow = RiskWorkflow(
         audit_logger=workflow_audit,
         state_store=None,
-        prompt_registry=prompt_registry,
+        prompt_registry=unapproved_prompt_registry,
     )
     state = RiskState(
         event_id="e8b",
@@ -314,10 +387,84 @@ async def test_risk_workflow_prompt_not_approved_emits_governance_violation_audi
     )
     with pytest.raises(PromptNotApprovedError):
         await workflow.run(state)
-    workflow_audit.log_action.assert_awaited_once()
-    call_kw = workflow_audit.log_action.call_args[1]
+    (call_kw,) = workflow_audit.actions
     assert call_kw["action"] == "GOVERNANCE_VIOLATION"
     assert call_kw["tenant_id"] == "t1"
     assert call_kw["correlation_id"] == "c8b"
     assert call_kw["resource_type"] == "prompt"
     assert call_kw["resource_id"] == "risk-prompt"
+    assert workflow_audit.flush_count == 1
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_governance_violation_flushed_from_buffered_logger(
+    unapproved_prompt_registry,
+):
+    """With a BufferedAuditLogger, the GOVERNANCE_VIOLATION record is written before raising."""
+    from app.governance.exceptions import PromptNotApprovedError
+
+    audit_repo = AsyncMock()
+    buffered = BufferedAuditLogger(audit_repo, max_size=100)
+    workflow = RiskWorkflow(
+        audit_logger=buffered,
+        state_store=None,
+        prompt_registry=unapproved_prompt_registry,
+    )
+    state = RiskState(
+        event_id="e8c",
+        tenant_id="t1",
+        correlation_id="c8c",
+        raw_event={"event_type": "standard"},
+        audit_trail=[],
+    )
+    try:
+        with pytest.raises(PromptNotApprovedError):
+            await workflow.run(state)
+        assert buffered.pending_count == 0
+        (batch,) = audit_repo.save_many.await_args.args
+        assert [r.action for r in batch] == ["GOVERNANCE_VIOLATION"]
+    finally:
+        await buffered.close()
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_model_and_prompt_checked_concurrently_model_wins(
+    spy_audit_logger,
+):
+    """Both registries are queried; when both reject, the model violation is the one raised and audited."""
+    from app.governance.prompt_registry import PromptRegistry
+
+    model_repo = AsyncMock()
+    model_repo.get_latest = AsyncMock(return_value=None)
+    prompt_repo = AsyncMock()
+    prompt_repo.get = AsyncMock(return_value=None)
+    prompt_repo.get_versions = AsyncMock(return_value=[])
+    workflow_audit = spy_audit_logger
+    workflow = RiskWorkflow(
+        audit_logger=workflow_audit,
+        state_store=None,
+        model_registry=ModelRegistry(repository=model_repo, audit_logger=AsyncMock()),
+        prompt_registry=PromptRegistry(
+            repository=prompt_repo, audit_logger=AsyncMock()
+        ),
+    )
+    state = RiskState(event_id="e9", tenant_id="t1", correlation_id="c9")
+    with pytest.raises(ModelNotApprovedError):
+        await workflow.run(state)
+    model_repo.get_latest.assert_awaited_once_with("risk-model")
+    prompt_repo.get.assert_awaited_once_with("risk-prompt", None)
+    assert [kw["resource_type"] for kw in workflow_audit.actions] == ["model"]
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_non_string_event_type_completes(audit_logger):
+    """Unhashable client values in raw_event must not crash the run."""
+    workflow = RiskWorkflow(audit_logger=audit_logger, state_store=None)
+    state = RiskState(
+        event_id="e10",
+        tenant_id="t1",
+        correlation_id="c10",
+        raw_event={"event_type": ["x"], "metadata": {"category": ["a"]}},
+    )
+    out = await workflow.run(state)
+    assert out.final_decision == "APPROVED"
@@ -1,7 +1,11 @@
 """State tests: immutable transitions, serialization."""
 
+import dataclasses
 import json
+import sys
 
+import pytest
+from pydantic import ValidationError
 
 from app.workflows.langgraph.state_models import ComplianceState, RiskState
 
@@ -35,8 +39,17 @@ def test_risk_state_immutable_transition_no_in_place_mutation():
     assert state.retrieved_context is None
 
 
+def test_appended_audit_trail_leaves_original_untouched():
+    """appended_audit_trail returns a new list; the state's own trail is not mutated."""
+    entry = {"node": "retrieval"}
+    state = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1")
+    trail = state.appended_audit_trail(entry)
+    assert trail == [entry]
+    assert state.audit_trail == []
+
+
 def test_risk_state_serialization_roundtrip():
-    """State must be fully serializable (model_dump_json / model_validate_json)."""
+    """State must be fully serializable (to_json / from_json)."""
     state = RiskState(
         event_id="e1",
         tenant_id="t1",
@@ -47,16 +60,38 @@ def test_risk_state_serialization_roundtrip():
         risk_score=30.0,
         audit_trail=[{"node": "retrieval", "at": "2025-01-01T00:00:00Z"}],
     )
-    data = state.model_dump_json()
+    data = state.to_json()
     parsed = json.loads(data)
     assert parsed["event_id"] == "e1"
     assert parsed["risk_score"] == 30.0
-    restored = RiskState.model_validate_json(data)
+    restored = RiskState.from_json(data)
     assert restored.event_id == state.event_id
     assert restored.risk_score == state.risk_score
     assert restored.audit_trail == state.audit_trail
 
 
+def test_state_parsing_interns_event_type():
+    """from_json / from_api intern raw_event["event_type"]."""
+    event_type = b"high_risk".decode()  # built at runtime, not interned
+    state = RiskState(
+        event_id="e1",
+        tenant_id="t1",
+        correlation_id="c1",
+        raw_event={"event_type": event_type},
+    )
+    restored = RiskState.from_json(state.to_json())
+    assert restored.raw_event["event_type"] is sys.intern("high_risk")
+    api_state = ComplianceState.from_api(
+        {
+            "event_id": "e1",
+            "tenant_id": "t1",
+            "correlation_id": "c1",
+            "raw_event": {"event_type": event_type},
+        }
+    )
+    assert api_state.raw_event["event_type"] is sys.intern("high_risk")
+
+
 def test_compliance_state_has_regulatory_flags_and_approval_required():
     """ComplianceState must include regulatory_flags and approval_required."""
     state = ComplianceState(
@@ -66,11 +101,12 @@ def test_compliance_state_has_regulatory_flags_and_approval_required():
         regulatory_flags=["GDPR", "SOX"],
         approval_required=True,
     )
-    assert state.regulatory_flags == ["GDPR", "SOX"]
+    assert state.regulatory_flags == ("GDPR", "SOX")
     assert state.approval_required is True
     new_state = state.transition(approval_required=False)
     assert new_state.approval_required is False
     assert state.approval_required is True
+    assert new_state.regulatory_flags == state.regulatory_flags
 
 
 def test_compliance_state_serialization_roundtrip():
@@ -79,9 +115,57 @@ def test_compliance_state_serialization_roundtrip():
         event_id="e1",
         tenant_id="t1",
         correlation_id="c1",
-        regulatory_flags=["F1"],
+        regulatory_flags=["SOX", "GDPR", "F1"],
         approval_required=True,
     )
-    restored = ComplianceState.model_validate_json(state.model_dump_json())
-    assert restored.regulatory_flags == state.regulatory_flags
+    data = state.to_json()
+    assert '"regulatory_flags":["SOX","GDPR","F1"]' in data
+    restored = ComplianceState.from_json(data)
+    assert restored.regulatory_flags == ("SOX", "GDPR", "F1")
+    assert all(flag is sys.intern(flag) for flag in restored.regulatory_flags)
     assert restored.approval_required == state.approval_required
+
+
+def test_compliance_state_rejects_bare_string_regulatory_flags():
+    """A single str is not split into one flag per character."""
+    with pytest.raises(TypeError):
+        ComplianceState(
+            event_id="e1", tenant_id="t1", correlation_id="c1", regulatory_flags="GDPR"
+        )
+    with pytest.raises(ValidationError):
+        ComplianceState.from_api(
+            {
+                "event_id": "e1",
+                "tenant_id": "t1",
+                "correlation_id": "c1",
+                "regulatory_flags": "GDPR",
+            }
+        )
+
+
+@pytest.mark.parametrize("flags", [["GDPR", 1], ("GDPR", 1)])
+def test_compliance_state_rejects_non_string_regulatory_flags(flags):
+    """Lists and tuples are checked alike: every flag must be a str."""
+    with pytest.raises(TypeError):
+        ComplianceState(
+            event_id="e1", tenant_id="t1", correlation_id="c1", regulatory_flags=flags
+        )
+
+
+def test_compliance_state_interns_tuple_regulatory_flags():
+    """A caller-built tuple is interned like a list."""
+    flag = b"GDPR".decode()  # built at runtime, not interned
+    state = ComplianceState(
+        event_id="e1", tenant_id="t1", correlation_id="c1", regulatory_flags=(flag,)
+    )
+    assert state.regulatory_flags[0] is sys.intern("GDPR")
+
+
+def test_states_are_frozen():
+    """States are shared by caches, so attributes cannot be reassigned in place."""
+    risk = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1")
+    compliance = ComplianceState(event_id="e1", tenant_id="t1", correlation_id="c1")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        risk.final_decision = "APPROVED"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        compliance.approval_required = True
@@ -1,10 +1,14 @@
 """Failure tests: node failure propagates, invalid state rejected, tenant isolation."""
 
-from unittest.mock import AsyncMock
+import asyncio
+import gc
+import logging
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.governance.audit_logger import AuditLogger
+from app.workflows.langgraph import risk_workflow
 from app.workflows.langgraph.nodes.decision import make_decision
 from app.workflows.langgraph.nodes.retrieval import retrieve_context
 from app.workflows.langgraph.risk_workflow import RiskWorkflow
@@ -40,12 +44,66 @@ async def test_workflow_failure_propagates(audit_logger):
         await workflow.run(state)
 
 
+@pytest.mark.asyncio
+async def test_fan_out_failure_cancels_sibling_nodes(audit_logger):
+    """A failing fan-out node cancels the still-running siblings; its error propagates as is."""
+    sibling_cancelled = asyncio.Event()
+
+    async def slow_retrieval(state, *, audit_logger):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+
+    async def failing_scoring(state, *, audit_logger):
+        raise ValueError("scoring failed")
+
+    state = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1")
+    with (
+        patch.object(risk_workflow, "retrieve_context", slow_retrieval),
+        patch.object(risk_workflow, "score_risk", failing_scoring),
+    ):
+        workflow = RiskWorkflow(audit_logger=audit_logger, state_store=None)
+        with pytest.raises(ValueError, match="scoring failed"):
+            await asyncio.wait_for(workflow.run(state), timeout=5)
+    assert sibling_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_all_nodes_failing_retrieves_every_error(caplog):
+    """When every fan-out node fails, the first error propagates and none is left unretrieved."""
+    failing_repo = AsyncMock()
+    failing_repo.save = AsyncMock(side_effect=RuntimeError("save failed"))
+    workflow = RiskWorkflow(
+        audit_logger=AuditLogger(repository=failing_repo), state_store=None
+    )
+    state = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1")
+    with caplog.at_level(logging.ERROR, logger="asyncio"):
+        with pytest.raises(RuntimeError, match="save failed"):
+            await workflow.run(state)
+        gc.collect()
+    assert failing_repo.save.await_count == 3
+    assert "never retrieved" not in caplog.text
+
+
 def test_invalid_state_rejected():
-    """Invalid state (missing required fields) must be rejected by Pydantic."""
+    """Invalid state (missing required fields) must be rejected; from_api validates types."""
     from pydantic import ValidationError
 
-    with pytest.raises(ValidationError):
+    with pytest.raises(TypeError):
         RiskState(event_id="e1")  # missing tenant_id, correlation_id
+    with pytest.raises(ValidationError):
+        RiskState.from_api({"event_id": "e1"})
+    with pytest.raises(ValidationError):
+        RiskState.from_api(
+            {
+                "event_id": "e1",
+                "tenant_id": "t1",
+                "correlation_id": "c1",
+                "raw_event": 1,
+            }
+        )
     # Minimal valid state
     state = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1")
     assert state.tenant_id == "t1"